@@ -1,8 +1,9 @@
 # app/models/review.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Boolean, Index, Enum, JSON, text
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
+import enum
 
 class Review(Base):
     __tablename__ = "reviews"
@@ -22,20 +23,53 @@ class Review(Base):
     user = relationship("User", back_populates="reviews")
     hospital = relationship("Hospital", back_populates="reviews")
     images = relationship("ReviewImage", back_populates="review", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # 병원별 최신순 목록 / 키셋 페이지네이션
+        Index("ix_reviews_hospital_created_at", hospital_id, created_at.desc(), id.desc()),
+        # 병원별 평점 높은순 목록 (역방향 스캔) / 평점 필터
+        Index("ix_reviews_hospital_rating_created_at", hospital_id, rating, created_at, id),
+        # 병원별 평점 낮은순 목록 (평점 오름차순, 같은 평점 내 최신순 - 정방향 스캔)
+        Index("ix_reviews_hospital_rating_low", hospital_id, rating, created_at.desc(), id.desc()),
+        # 내가 작성한 리뷰 목록
+        Index("ix_reviews_user_created_at", user_id, created_at.desc(), id.desc()),
+    )
+
+class ReviewImageVariantStatus(enum.Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    READY = "ready"
+    FAILED = "failed"
 
 class ReviewImage(Base):
     __tablename__ = "review_images"
     
     id = Column(Integer, primary_key=True, index=True)
-    review_id = Column(Integer, ForeignKey("reviews.id"))
+    review_id = Column(Integer, ForeignKey("reviews.id"), index=True)
     image_url = Column(String(500))
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    # 리사이즈 변형 이미지 {포맷: {너비: URL}} (이미지 변환 파이프라인이 채움)
+    variants = Column(JSON)
+    variant_status = Column(Enum(ReviewImageVariantStatus), nullable=False, default=ReviewImageVariantStatus.PENDING)
+    variant_attempts = Column(Integer, nullable=False, default=0)
+    variant_available_at = Column(DateTime, default=datetime.utcnow)  # 다음 처리 가능 시각 (처리 중이면 선점 만료 시각)
+    variant_error = Column(Text)
+    
     review = relationship("Review", back_populates="images")
+    
+    __table_args__ = (
+        # 변환 대기 이미지 폴링
+        Index(
+            "ix_review_images_variant_pending",
+            variant_available_at,
+            postgresql_where=text("variant_status IN ('PENDING', 'PROCESSING')")
+        ),
+    )
 
 # app/schemas/review.py
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class ReviewImageBase(BaseModel):
@@ -44,6 +78,8 @@ class ReviewImageBase(BaseModel):
 class ReviewImageResponse(ReviewImageBase):
     id: int
     created_at: datetime
+    # {"webp": {"320": URL, "960": URL}, "avif": {...}} - 목록/썸네일은 원본 대신 사용, 변환 전이면 None
+    variants: Optional[Dict[str, Dict[str, str]]] = None
     
     class Config:
         from_attributes = True
@@ -52,21 +88,28 @@ class ReviewBase(BaseModel):
     rating: float = Field(..., ge=1.0, le=5.0)
     comment: Optional[str] = Field(None, max_length=1000)
 
+def validate_half_step_rating(v: Optional[float]) -> Optional[float]:
+    # 0.5 단위로만 허용 (1.0, 1.5, 2.0, ..., 5.0) - 병원 평점 분포 버킷과 일치해야 함
+    if v is not None and v * 2 != int(v * 2):
+        raise ValueError('평점은 0.5 단위로만 입력 가능합니다.')
+    return v
+
 class ReviewCreate(ReviewBase):
     reservation_id: int
     images: Optional[List[str]] = []
     
     @validator('rating')
     def validate_rating(cls, v):
-        # 0.5 단위로만 허용 (1.0, 1.5, 2.0, ..., 5.0)
-        if v * 2 != int(v * 2):
-            raise ValueError('평점은 0.5 단위로만 입력 가능합니다.')
-        return v
+        return validate_half_step_rating(v)
 
 class ReviewUpdate(BaseModel):
     rating: Optional[float] = Field(None, ge=1.0, le=5.0)
     comment: Optional[str] = Field(None, max_length=1000)
     images: Optional[List[str]] = None
+    
+    @validator('rating')
+    def validate_rating(cls, v):
+        return validate_half_step_rating(v)
 
 class ReviewResponse(ReviewBase):
     id: int
@@ -82,19 +125,504 @@ class ReviewResponse(ReviewBase):
     class Config:
         from_attributes = True
 
+class ReviewableCheckRequest(BaseModel):
+    # 생략 시 최근 30일 내 완료된 내 예약 전체를 확인
+    reservation_ids: Optional[List[int]] = Field(None, min_length=1, max_length=100)
+
+class ReviewableStatus(BaseModel):
+    reservation_id: int
+    reviewable: bool
+    reason: Optional[str] = None
+
+class ReviewableCheckResponse(BaseModel):
+    results: List[ReviewableStatus]
+
 class ReviewListResponse(BaseModel):
     reviews: List[ReviewResponse]
     total_count: int
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor 로 전달, 마지막 페이지면 None
     average_rating: float
-    rating_distribution: dict  # {5: 10, 4: 5, 3: 2, 2: 1, 1: 0}
+    rating_distribution: dict  # {1.0: 0, 1.5: 0, ..., 4.5: 5, 5.0: 10}
+
+# app/services/hospital_rating.py
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, cast, Numeric
+from typing import Optional
+from app.models.review import Review
+from app.models.hospital import Hospital
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# 평점 분포 버킷: 1.0 ~ 5.0, 0.5 단위 9개
+RATING_BUCKETS = [1.0 + 0.5 * i for i in range(9)]
+
+def rating_bucket_index(rating: float) -> int:
+    """평점의 분포 배열 위치 (PostgreSQL ARRAY는 1부터 시작: 1.0 -> 1, 5.0 -> 9)
+    
+    0.5 단위가 아닌 기존 평점은 가장 가까운 버킷 (동률이면 위쪽) 으로 보낸다.
+    마이그레이션 0002 의 ROUND(numeric) 과 같은 반올림이라야 하므로 round() (짝수 반올림) 를 쓰지 않는다.
+    """
+    return min(max(math.floor((rating - 1.0) * 2 + 0.5), 0), len(RATING_BUCKETS) - 1) + 1
+
+def build_rating_distribution(rating_histogram) -> dict:
+    """병원 평점 분포 배열을 {평점: 리뷰 수} 로 변환"""
+    histogram = rating_histogram or [0] * len(RATING_BUCKETS)
+    return {rating: count for rating, count in zip(RATING_BUCKETS, histogram)}
+
+def _average_expression(rating_sum, review_count):
+    return case(
+        (review_count > 0, func.round(cast(rating_sum / review_count, Numeric), 1)),
+        else_=0
+    )
+
+def apply_hospital_rating_delta(
+    db: Session,
+    hospital_id: int,
+    added: Optional[float] = None,
+    removed: Optional[float] = None
+):
+    """리뷰 작성(added)/삭제(removed)/평점 수정(둘 다)의 증감분을 병원 행에 단일 UPDATE로 반영"""
+    if added == removed:
+        return
+    
+    hospitals = Hospital.__table__
+    sum_delta = (added or 0) - (removed or 0)
+    count_delta = (added is not None) - (removed is not None)
+    new_sum = hospitals.c.rating_sum + sum_delta
+    new_count = hospitals.c.review_count + count_delta
+    
+    values = {
+        hospitals.c.rating_sum: new_sum,
+        hospitals.c.review_count: new_count,
+        hospitals.c.average_rating: _average_expression(new_sum, new_count)
+    }
+    added_index = rating_bucket_index(added) if added is not None else None
+    removed_index = rating_bucket_index(removed) if removed is not None else None
+    # 같은 버킷 안에서의 수정은 분포가 그대로 (같은 원소를 두 번 SET 하면 한쪽만 반영됨)
+    if added_index != removed_index:
+        if added_index is not None:
+            values[hospitals.c.rating_histogram[added_index]] = hospitals.c.rating_histogram[added_index] + 1
+        if removed_index is not None:
+            values[hospitals.c.rating_histogram[removed_index]] = hospitals.c.rating_histogram[removed_index] - 1
+    
+    db.execute(hospitals.update().where(hospitals.c.id == hospital_id).values(values))
+
+def reconcile_hospital_ratings(db: Session, batch_size: int = 500) -> int:
+    """리뷰 원본 기준으로 병원 평점 집계 드리프트 검사 및 복구, 복구된 병원 수 반환"""
+    hospitals = Hospital.__table__
+    repaired = 0
+    last_id = 0
+    
+    while True:
+        batch = db.query(
+            Hospital.id,
+            Hospital.rating_sum,
+            Hospital.review_count,
+            Hospital.rating_histogram
+        ).filter(Hospital.id > last_id).order_by(Hospital.id).limit(batch_size).all()
+        
+        if not batch:
+            break
+        last_id = batch[-1].id
+        
+        # 배치 내 병원들의 실제 평점 분포 (GROUP BY 1회)
+        actual = {hospital.id: [0.0, 0, [0] * len(RATING_BUCKETS)] for hospital in batch}
+        rows = db.query(
+            Review.hospital_id,
+            Review.rating,
+            func.count(Review.id)
+        ).filter(
+            Review.hospital_id.in_(actual.keys())
+        ).group_by(Review.hospital_id, Review.rating).all()
+        
+        for hospital_id, rating, count in rows:
+            stats = actual[hospital_id]
+            stats[0] += rating * count
+            stats[1] += count
+            stats[2][rating_bucket_index(rating) - 1] += count
+        
+        for hospital in batch:
+            rating_sum, review_count, histogram = actual[hospital.id]
+            if (
+                abs((hospital.rating_sum or 0) - rating_sum) < 1e-6
+                and hospital.review_count == review_count
+                and list(hospital.rating_histogram or []) == histogram
+            ):
+                continue
+            
+            logger.warning(
+                f"병원 평점 집계 불일치 복구: hospital_id={hospital.id}, "
+                f"sum {hospital.rating_sum} -> {rating_sum}, count {hospital.review_count} -> {review_count}"
+            )
+            # 검사 이후 리뷰가 새로 반영된 병원은 건너뛰고 다음 실행에서 다시 검사
+            result = db.execute(
+                hospitals.update().where(
+                    hospitals.c.id == hospital.id,
+                    hospitals.c.review_count == hospital.review_count,
+                    hospitals.c.rating_sum == hospital.rating_sum
+                ).values(
+                    rating_sum=rating_sum,
+                    review_count=review_count,
+                    rating_histogram=histogram,
+                    average_rating=round(rating_sum / review_count, 1) if review_count else 0
+                )
+            )
+            repaired += result.rowcount
+        
+        db.commit()
+    
+    return repaired
+
+# app/utils/image_variants.py
+from typing import Dict, List
+import io
+import os
+
+# 변형 포맷별 Pillow 포맷 이름과 인코딩 옵션
+VARIANT_ENCODERS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "avif": ("AVIF", {"quality": 60}),
+}
+
+def render_image_variants(source: bytes, output_dir: str, widths: List[int], formats: List[str]) -> Dict[str, Dict[str, str]]:
+    """원본 이미지로 너비별 변형 파일 생성 (프로세스 풀 워커에서 실행)
+    
+    {포맷: {실제 너비: output_dir 기준 파일명}} 반환. 원본보다 큰 너비로 확대하지 않으며,
+    설치된 Pillow 가 인코딩하지 못하는 포맷 (예: AVIF 미지원 빌드) 은 건너뛴다.
+    워커 프로세스가 DB/설정 모듈을 불러오지 않도록 이 모듈은 표준 라이브러리와 Pillow 만 사용한다.
+    """
+    from PIL import Image, ImageOps
+    
+    Image.init()
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(source)))
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    variants = {}
+    for width in sorted({min(width, image.width) for width in widths}):
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.LANCZOS)
+        else:
+            resized = image
+        
+        for format in formats:
+            pil_format, options = VARIANT_ENCODERS[format]
+            if pil_format not in Image.SAVE:
+                continue
+            filename = f"w{width}.{format}"
+            path = os.path.join(output_dir, filename)
+            resized.save(path + ".part", format=pil_format, **options)
+            os.replace(path + ".part", path)
+            variants.setdefault(format, {})[str(width)] = filename
+    
+    return variants
+
+# app/services/review_images.py
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+from urllib.parse import urlsplit
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.circuit_breaker import backoff_delay
+from app.database import AsyncSessionLocal
+from app.models.review import ReviewImage, ReviewImageVariantStatus
+from app.utils.image_variants import render_image_variants
+import asyncio
+import httpx
+import importlib.util
+import multiprocessing
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+class UnsupportedImageSource(Exception):
+    """변환할 수 없는 원본 (허용되지 않은 주소, 크기 초과) - 재시도하지 않음"""
+
+def _read_local_source(path: str, max_bytes: int) -> bytes:
+    if os.path.getsize(path) > max_bytes:
+        raise UnsupportedImageSource(f"원본 이미지가 너무 큽니다: {path}")
+    with open(path, "rb") as f:
+        return f.read()
+
+async def fetch_image_source(client: httpx.AsyncClient, url: str) -> bytes:
+    """원본 이미지 조회 (업로드 저장소 URL 이면 로컬 파일, 허용된 호스트면 HTTP)
+    
+    image_url 은 클라이언트가 보낸 값이므로 임의 주소로의 요청 (SSRF) 을 막기 위해
+    REVIEW_IMAGE_SOURCE_HOSTS 의 https 주소만 내려받는다.
+    """
+    max_bytes = settings.REVIEW_IMAGE_MAX_SOURCE_BYTES
+    
+    base_url = settings.REVIEW_IMAGE_SOURCE_BASE_URL.rstrip("/")
+    if base_url and settings.REVIEW_IMAGE_SOURCE_DIR and url.startswith(base_url + "/"):
+        root = os.path.realpath(settings.REVIEW_IMAGE_SOURCE_DIR)
+        path = os.path.realpath(os.path.join(root, urlsplit(url[len(base_url) + 1:]).path))
+        if not path.startswith(root + os.sep):
+            raise UnsupportedImageSource(f"저장소 밖의 경로입니다: {url}")
+        return await run_in_threadpool(_read_local_source, path, max_bytes)
+    
+    parts = urlsplit(url)
+    if parts.scheme != "https" or parts.hostname not in settings.REVIEW_IMAGE_SOURCE_HOSTS:
+        raise UnsupportedImageSource(f"허용되지 않은 이미지 주소입니다: {url}")
+    
+    chunks = []
+    size = 0
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                raise UnsupportedImageSource(f"원본 이미지가 너무 큽니다: {url}")
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+def variant_url(image_id: int, filename: str) -> str:
+    return f"{settings.REVIEW_IMAGE_VARIANT_BASE_URL.rstrip('/')}/{image_id}/{filename}"
+
+async def claim_review_images(db: AsyncSession, limit: int) -> list:
+    """변환할 이미지를 PROCESSING 으로 선점 (여러 워커가 동시에 폴링해도 중복 없음)
+    
+    선점 만료 (variant_available_at) 가 지난 PROCESSING 행은 처리 도중 워커가 종료된 것으로 보고
+    다시 가져오며, 이미 최대 시도 횟수를 쓴 행은 FAILED 로 정리한다.
+    """
+    table = ReviewImage.__table__
+    now = datetime.utcnow()
+    due = and_(
+        table.c.variant_status.in_([ReviewImageVariantStatus.PENDING, ReviewImageVariantStatus.PROCESSING]),
+        table.c.variant_available_at <= now
+    )
+    
+    await db.execute(
+        table.update()
+        .where(due, table.c.variant_attempts >= settings.REVIEW_IMAGE_MAX_ATTEMPTS)
+        .values(variant_status=ReviewImageVariantStatus.FAILED, variant_error="처리 시간 초과")
+    )
+    
+    candidates = (
+        select(table.c.id)
+        .where(due)
+        .order_by(table.c.variant_available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (await db.execute(
+        table.update()
+        .where(table.c.id.in_(candidates))
+        .values(
+            variant_status=ReviewImageVariantStatus.PROCESSING,
+            variant_available_at=now + timedelta(seconds=settings.REVIEW_IMAGE_LOCK_TIMEOUT_SECONDS),
+            variant_attempts=table.c.variant_attempts + 1
+        )
+        .returning(table.c.id, table.c.image_url, table.c.variant_attempts)
+    )).all()
+    await db.commit()
+    return rows
+
+async def finish_review_image(
+    db: AsyncSession,
+    image_id: int,
+    variants: Optional[dict] = None,
+    error: Optional[str] = None,
+    retry_delay: Optional[float] = None
+):
+    """처리 결과 반영 (성공 READY, 재시도 예약 PENDING, 실패 FAILED)
+    
+    처리 도중 리뷰 수정으로 이미지 행이 삭제됐으면 아무것도 갱신하지 않는다.
+    """
+    if error is None:
+        values = {"variant_status": ReviewImageVariantStatus.READY, "variants": variants, "variant_error": None}
+    elif retry_delay is not None:
+        values = {
+            "variant_status": ReviewImageVariantStatus.PENDING,
+            "variant_available_at": datetime.utcnow() + timedelta(seconds=retry_delay),
+            "variant_error": error
+        }
+    else:
+        values = {"variant_status": ReviewImageVariantStatus.FAILED, "variant_error": error}
+    
+    await db.execute(
+        update(ReviewImage)
+        .where(
+            ReviewImage.id == image_id,
+            ReviewImage.variant_status == ReviewImageVariantStatus.PROCESSING
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+class ReviewImagePipeline:
+    """리뷰 이미지 변형 생성 파이프라인 (앱 시작 시 백그라운드 태스크로 실행)
+    
+    리뷰 작성/수정 트랜잭션에서 PENDING 으로 저장된 review_images 행이 작업 큐 역할을 한다.
+    디코딩/리사이즈/인코딩은 CPU 코어 수만큼의 프로세스 풀에서 실행해 이벤트 루프와 GIL 을 막지 않는다.
+    """
+    
+    def __init__(self, batch_size: int = 20, poll_interval: float = 5.0, max_workers: int = 0):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    async def start(self):
+        if self._task is not None:
+            return
+        if importlib.util.find_spec("PIL") is None:
+            logger.warning("Pillow 가 설치되지 않아 리뷰 이미지 변환을 시작하지 않습니다.")
+            return
+        
+        # fork 는 이벤트 루프/DB 커넥션 풀 스레드가 있는 프로세스를 복제하므로 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self._client = httpx.AsyncClient(timeout=settings.REVIEW_IMAGE_FETCH_TIMEOUT)
+        # 다운로드 대기 중에도 프로세스 풀이 쉬지 않도록 워커 수보다 넉넉히 동시 처리
+        self._semaphore = asyncio.Semaphore(self.max_workers * 2)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._client.aclose()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def notify(self):
+        """새 이미지 저장 알림 - 같은 프로세스의 파이프라인이 폴링 주기를 기다리지 않고 처리"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def _run(self):
+        while True:
+            try:
+                processed = await self.process_once()
+            except Exception as e:
+                logger.exception(f"리뷰 이미지 변환 디스패치 실패: {e}")
+                processed = 0
+            # 밀린 이미지가 있으면 바로 다음 배치
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+    
+    async def process_once(self) -> int:
+        """이미지 한 배치 처리 (처리한 이미지 수 반환)"""
+        async with AsyncSessionLocal() as db:
+            images = await claim_review_images(db, self.batch_size)
+        await asyncio.gather(*(self._process(image) for image in images))
+        return len(images)
+    
+    async def _process(self, image):
+        async with self._semaphore:
+            variants = None
+            error = None
+            retry_delay = None
+            try:
+                source = await fetch_image_source(self._client, image.image_url)
+                files = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    render_image_variants,
+                    source,
+                    os.path.join(settings.REVIEW_IMAGE_VARIANT_DIR, str(image.id)),
+                    settings.REVIEW_IMAGE_WIDTHS,
+                    settings.REVIEW_IMAGE_FORMATS
+                )
+                variants = {
+                    format: {width: variant_url(image.id, filename) for width, filename in by_width.items()}
+                    for format, by_width in files.items()
+                }
+            except UnsupportedImageSource as e:
+                error = str(e)
+            except Exception as e:
+                logger.exception(f"리뷰 이미지 변환 실패: image_id={image.id}, {e}")
+                error = str(e) or type(e).__name__
+                if image.variant_attempts < settings.REVIEW_IMAGE_MAX_ATTEMPTS:
+                    retry_delay = backoff_delay(
+                        image.variant_attempts - 1,
+                        settings.REVIEW_IMAGE_RETRY_BASE_DELAY,
+                        settings.REVIEW_IMAGE_RETRY_MAX_DELAY
+                    )
+            
+            async with AsyncSessionLocal() as db:
+                await finish_review_image(db, image.id, variants, error, retry_delay)
+
+review_image_pipeline = ReviewImagePipeline(
+    batch_size=settings.REVIEW_IMAGE_BATCH_SIZE,
+    poll_interval=settings.REVIEW_IMAGE_POLL_INTERVAL,
+    max_workers=settings.REVIEW_IMAGE_WORKERS
+)
+
+# app/core/pagination.py
+from fastapi import HTTPException, status
+import base64
+import json
+
+def encode_cursor(position: dict) -> str:
+    """키셋 페이지네이션 위치를 불투명 커서 문자열로 인코딩"""
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> dict:
+    """커서 문자열 디코딩 (형식 오류 시 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        position = None
+    
+    if not isinstance(position, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다."
+        )
+    
+    return position
+
+# app/core/responses.py
+from fastapi import Response
+from pydantic_core import to_json
+from typing import Any, Optional
+
+def json_bytes_response(content: Any, headers: Optional[dict] = None) -> Response:
+    """이미 검증된 dict/list 를 JSON 바이트로 한 번만 직렬화해 응답
+    
+    Response 를 직접 반환하면 FastAPI 가 response_model 재검증을 건너뛴다
+    (response_model 은 OpenAPI 문서용으로만 유지). datetime 은 pydantic 과 같은 ISO 형식으로 직렬화된다.
+    """
+    return Response(content=to_json(content), media_type="application/json", headers=headers)
 
 # app/api/v1/endpoints/review.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, delete, and_, or_, tuple_
 from typing import List, Optional
+from collections import Counter
 from datetime import datetime, timedelta
-from app.database import get_db
+from app.database import get_async_db
+from app.api.v1.dependencies import get_read_db_for_hospital, get_read_db_for_user
+from app.core.read_routing import primary_stickiness
 from app.models.review import Review, ReviewImage
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.hospital import Hospital
@@ -103,25 +631,44 @@ from app.schemas.review import (
     ReviewCreate, 
     ReviewUpdate, 
     ReviewResponse, 
-    ReviewListResponse
+    ReviewListResponse,
+    ReviewableCheckRequest,
+    ReviewableCheckResponse
 )
 from app.api.v1.endpoints.auth import get_current_user
+from app.core.cache import statistics_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import json_bytes_response
+from app.services.hospital_rating import apply_hospital_rating_delta, build_rating_distribution
+from app.services.review_images import review_image_pipeline
 
 router = APIRouter()
 
+async def load_review_with_images(db: AsyncSession, review_id: int) -> Review:
+    """응답 직렬화용 리뷰 재조회 (비동기 세션에서는 지연 로딩을 쓸 수 없어 이미지를 함께 로드)"""
+    result = await db.execute(
+        select(Review)
+        .options(selectinload(Review.images))
+        .where(Review.id == review_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
 @router.post("/", response_model=ReviewResponse)
 async def create_review(
     review_data: ReviewCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """리뷰 작성"""
     # 예약 확인
-    reservation = db.query(Reservation).filter(
-        Reservation.id == review_data.reservation_id,
-        Reservation.user_id == current_user.id,
-        Reservation.status == ReservationStatus.COMPLETED
-    ).first()
+    reservation = (await db.execute(
+        select(Reservation).where(
+            Reservation.id == review_data.reservation_id,
+            Reservation.user_id == current_user.id,
+            Reservation.status == ReservationStatus.COMPLETED
+        )
+    )).scalars().first()
     
     if not reservation:
         raise HTTPException(
@@ -137,9 +684,9 @@ async def create_review(
         )
     
     # 중복 리뷰 확인
-    existing_review = db.query(Review).filter(
-        Review.reservation_id == review_data.reservation_id
-    ).first()
+    existing_review = (await db.execute(
+        select(Review.id).where(Review.reservation_id == review_data.reservation_id)
+    )).first()
     
     if existing_review:
         raise HTTPException(
@@ -157,7 +704,7 @@ async def create_review(
         is_verified=True
     )
     db.add(review)
-    db.flush()
+    await db.flush()
     
     # 이미지 추가
     for image_url in review_data.images:
@@ -168,10 +715,14 @@ async def create_review(
         db.add(review_image)
     
     # 병원 평균 평점 업데이트
-    update_hospital_rating(db, reservation.hospital_id)
+    await db.run_sync(apply_hospital_rating_delta, reservation.hospital_id, added=review.rating)
     
-    db.commit()
-    db.refresh(review)
+    await db.commit()
+    await statistics_cache.invalidate_hospital_async(reservation.hospital_id)
+    await primary_stickiness.mark_write(user_id=current_user.id, hospital_id=reservation.hospital_id)
+    if review_data.images:
+        review_image_pipeline.notify()
+    review = await load_review_with_images(db, review.id)
     
     # 사용자 이름 추가
     review.user_name = current_user.name
@@ -185,110 +736,213 @@ async def get_hospital_reviews(
     limit: int = Query(10, ge=1, le=100),
     sort_by: str = Query("recent", regex="^(recent|rating_high|rating_low)$"),
     rating_filter: Optional[float] = Query(None, ge=1.0, le=5.0),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_read_db_for_hospital)
 ):
-    """병원별 리뷰 목록 조회"""
+    """병원별 리뷰 목록 조회 (cursor 사용 시 키셋 페이지네이션)"""
     # 병원 확인
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
+    hospital = await db.get(Hospital, hospital_id)
     if not hospital:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="병원을 찾을 수 없습니다."
         )
     
-    # 쿼리 빌드
-    query = db.query(Review).filter(Review.hospital_id == hospital_id)
+    # 페이지네이션 - 커서가 있으면 키셋, 없으면 기존 page 오프셋
+    position = decode_cursor(cursor) if cursor else None
+    query = hospital_reviews_query(hospital_id, sort_by, rating_filter, position)
+    if position is None and page > 1:
+        query = query.offset((page - 1) * limit)
     
-    # 평점 필터
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = review_cursor(sort_by, rows[-1])
+    
+    # 평균 평점 / 평점 분포 / 전체 개수 (리뷰 작성 시 병원 행에 갱신된 값 사용)
+    avg_rating = hospital.average_rating or 0
+    rating_distribution = build_rating_distribution(hospital.rating_histogram)
     if rating_filter:
-        query = query.filter(Review.rating == rating_filter)
+        total_count = rating_distribution.get(rating_filter, 0)
+    else:
+        total_count = hospital.review_count or 0
+    
+    # 응답 데이터 구성 - DB 에서 온 값이므로 ReviewResponse 검증 없이 바로 JSON 직렬화
+    images_by_review = await load_review_images(db, [row.id for row in rows])
+    reviews = []
+    for row in rows:
+        review = row._asdict()
+        review["images"] = images_by_review.get(row.id, [])
+        reviews.append(review)
+    
+    return json_bytes_response({
+        "reviews": reviews,
+        "total_count": total_count,
+        "next_cursor": next_cursor,
+        "average_rating": round(avg_rating, 1),
+        "rating_distribution": rating_distribution
+    })
+
+# 목록 응답(ReviewResponse)에 필요한 리뷰 컬럼 (images, user_name 은 별도 조회)
+REVIEW_LIST_COLUMNS = (
+    Review.id,
+    Review.reservation_id,
+    Review.user_id,
+    Review.hospital_id,
+    Review.rating,
+    Review.comment,
+    Review.is_verified,
+    Review.created_at,
+    Review.updated_at,
+)
+
+async def load_review_images(db: AsyncSession, review_ids: List[int]) -> dict:
+    """리뷰 id 목록의 이미지를 IN 쿼리 한 번으로 조회해 {review_id: [이미지 dict]} 로 반환
+    
+    selectinload 와 같은 쿼리지만 ORM 객체를 만들지 않고 ReviewImageResponse 필드만 가져온다.
+    """
+    images_by_review = {}
+    if not review_ids:
+        return images_by_review
+    
+    result = await db.execute(
+        select(ReviewImage.review_id, ReviewImage.id, ReviewImage.image_url, ReviewImage.created_at, ReviewImage.variants)
+        .where(ReviewImage.review_id.in_(review_ids))
+        .order_by(ReviewImage.review_id, ReviewImage.id)
+    )
+    for review_id, image_id, image_url, created_at, variants in result:
+        images_by_review.setdefault(review_id, []).append({
+            "image_url": image_url,
+            "id": image_id,
+            "created_at": created_at,
+            "variants": variants
+        })
     
-    # 정렬
+    return images_by_review
+
+REVIEW_SORT_ORDERS = {
+    "recent": (Review.created_at.desc(), Review.id.desc()),
+    "rating_high": (Review.rating.desc(), Review.created_at.desc(), Review.id.desc()),
+    "rating_low": (Review.rating.asc(), Review.created_at.desc(), Review.id.desc()),
+}
+
+def review_cursor(sort_by: str, review) -> str:
+    """목록 마지막 리뷰 위치로 다음 페이지 커서 생성 (Review 엔티티 또는 컬럼 조회 행)"""
+    return encode_cursor({
+        "s": sort_by,
+        "r": review.rating,
+        "c": review.created_at.isoformat(),
+        "i": review.id
+    })
+
+def review_keyset_predicate(sort_by: str, position: dict):
+    """커서 위치 이후의 리뷰 조건 (정렬별 복합 인덱스 범위 검색)"""
+    try:
+        if position["s"] != sort_by:
+            raise ValueError(position["s"])
+        rating = float(position["r"])
+        created_at = datetime.fromisoformat(position["c"])
+        review_id = int(position["i"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다."
+        )
+    
+    older = tuple_(Review.created_at, Review.id) < tuple_(created_at, review_id)
     if sort_by == "recent":
-        query = query.order_by(Review.created_at.desc())
-    elif sort_by == "rating_high":
-        query = query.order_by(Review.rating.desc(), Review.created_at.desc())
-    elif sort_by == "rating_low":
-        query = query.order_by(Review.rating.asc(), Review.created_at.desc())
-    
-    # 전체 개수
-    total_count = query.count()
-    
-    # 페이지네이션
-    reviews = query.options(
-        joinedload(Review.user),
-        joinedload(Review.images)
-    ).offset((page - 1) * limit).limit(limit).all()
-    
-    # 평균 평점 계산
-    avg_rating = db.query(func.avg(Review.rating)).filter(
-        Review.hospital_id == hospital_id
-    ).scalar() or 0
-    
-    # 평점 분포 계산
-    rating_dist = db.query(
-        Review.rating,
-        func.count(Review.id)
-    ).filter(
-        Review.hospital_id == hospital_id
-    ).group_by(Review.rating).all()
-    
-    rating_distribution = {float(i): 0 for i in range(1, 6)}
-    for rating, count in rating_dist:
-        rating_distribution[float(rating)] = count
-    
-    # 응답 데이터 구성
-    review_responses = []
-    for review in reviews:
-        review_dict = {
-            "id": review.id,
-            "reservation_id": review.reservation_id,
-            "user_id": review.user_id,
-            "hospital_id": review.hospital_id,
-            "rating": review.rating,
-            "comment": review.comment,
-            "is_verified": review.is_verified,
-            "created_at": review.created_at,
-            "updated_at": review.updated_at,
-            "images": review.images,
-            "user_name": review.user.name if review.user else None
-        }
-        review_responses.append(ReviewResponse(**review_dict))
+        return older
+    if sort_by == "rating_high":
+        return tuple_(Review.rating, Review.created_at, Review.id) < tuple_(rating, created_at, review_id)
+    # rating_low: 평점 오름차순, 같은 평점 내 최신순
+    return or_(Review.rating > rating, and_(Review.rating == rating, older))
+
+def hospital_reviews_query(
+    hospital_id: int,
+    sort_by: str,
+    rating_filter: Optional[float] = None,
+    position: Optional[dict] = None
+):
+    """병원 리뷰 목록 쿼리 (position 은 decode_cursor 결과, 없으면 첫 페이지)
     
-    return ReviewListResponse(
-        reviews=review_responses,
-        total_count=total_count,
-        average_rating=round(avg_rating, 1),
-        rating_distribution=rating_distribution
+    응답에 필요한 컬럼과 작성자 이름만 조회한다 (ORM 엔티티 / 관계 로딩 없음).
+    """
+    query = (
+        select(*REVIEW_LIST_COLUMNS, User.name.label("user_name"))
+        .outerjoin(User, User.id == Review.user_id)
+        .where(Review.hospital_id == hospital_id)
     )
+    
+    # 평점 필터
+    if rating_filter:
+        query = query.where(Review.rating == rating_filter)
+    
+    # 정렬 (id 를 마지막 정렬 키로 두어 순서를 고정)
+    query = query.order_by(*REVIEW_SORT_ORDERS[sort_by])
+    
+    if position is not None:
+        query = query.where(review_keyset_predicate(sort_by, position))
+    return query
+
+def my_reviews_query(user_id: int, position: Optional[dict] = None):
+    """내가 작성한 리뷰 목록 쿼리 (최신순, ix_reviews_user_created_at 범위 검색)"""
+    query = (
+        select(*REVIEW_LIST_COLUMNS)
+        .where(Review.user_id == user_id)
+        .order_by(*REVIEW_SORT_ORDERS["recent"])
+    )
+    if position is not None:
+        query = query.where(review_keyset_predicate("recent", position))
+    return query
 
 @router.get("/my-reviews", response_model=List[ReviewResponse])
 async def get_my_reviews(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답 X-Next-Cursor 헤더 값"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db_for_user)
 ):
-    """내가 작성한 리뷰 목록 조회"""
-    reviews = db.query(Review).filter(
-        Review.user_id == current_user.id
-    ).options(
-        joinedload(Review.images),
-        joinedload(Review.hospital)
-    ).order_by(Review.created_at.desc()).all()
+    """내가 작성한 리뷰 목록 조회 (최신순 키셋 페이지네이션)
+    
+    다음 페이지가 있으면 X-Next-Cursor 응답 헤더로 커서를 전달 (응답 본문은 기존과 같은 리뷰 배열).
+    """
+    query = my_reviews_query(current_user.id, decode_cursor(cursor) if cursor else None)
+    
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회 (ix_reviews_user_created_at 범위 검색)
+    rows = (await db.execute(query.limit(limit + 1))).all()
     
-    return reviews
+    headers = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers = {"X-Next-Cursor": review_cursor("recent", rows[-1])}
+    
+    images_by_review = await load_review_images(db, [row.id for row in rows])
+    reviews = []
+    for row in rows:
+        review = row._asdict()
+        review["images"] = images_by_review.get(row.id, [])
+        review["user_name"] = current_user.name
+        reviews.append(review)
+    
+    return json_bytes_response(reviews, headers=headers)
 
 @router.put("/{review_id}", response_model=ReviewResponse)
 async def update_review(
     review_id: int,
     review_update: ReviewUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """리뷰 수정"""
-    review = db.query(Review).filter(
-        Review.id == review_id,
-        Review.user_id == current_user.id
-    ).first()
+    review = (await db.execute(
+        select(Review).where(
+            Review.id == review_id,
+            Review.user_id == current_user.id
+        )
+    )).scalars().first()
     
     if not review:
         raise HTTPException(
@@ -304,45 +958,78 @@ async def update_review(
         )
     
     # 리뷰 업데이트
+    old_rating = review.rating
     if review_update.rating is not None:
         review.rating = review_update.rating
     if review_update.comment is not None:
         review.comment = review_update.comment
     
-    # 이미지 업데이트
+    # 이미지 업데이트 (바뀐 URL 만 추가/삭제)
+    added_images = 0
     if review_update.images is not None:
-        # 기존 이미지 삭제
-        db.query(ReviewImage).filter(ReviewImage.review_id == review_id).delete()
-        
-        # 새 이미지 추가
-        for image_url in review_update.images:
-            review_image = ReviewImage(
-                review_id=review_id,
-                image_url=image_url
-            )
-            db.add(review_image)
+        added_images = await sync_review_images(db, review_id, review_update.images)
     
     review.updated_at = datetime.utcnow()
     
-    # 병원 평균 평점 업데이트
-    update_hospital_rating(db, review.hospital_id)
+    # 병원 평균 평점 업데이트 (평점이 바뀐 경우만, 통계 대시보드는 병원 평균 평점만 사용)
+    rating_changed = review.rating != old_rating
+    if rating_changed:
+        await db.run_sync(apply_hospital_rating_delta, review.hospital_id, added=review.rating, removed=old_rating)
     
-    db.commit()
-    db.refresh(review)
+    await db.commit()
+    if rating_changed:
+        await statistics_cache.invalidate_hospital_async(review.hospital_id)
+    await primary_stickiness.mark_write(user_id=current_user.id, hospital_id=review.hospital_id)
+    if added_images:
+        review_image_pipeline.notify()
     
-    return review
+    return await load_review_with_images(db, review_id)
+
+async def sync_review_images(db: AsyncSession, review_id: int, image_urls: List[str]) -> int:
+    """리뷰 이미지를 요청한 URL 목록과 같게 맞춤 (추가된 이미지 수 반환)
+    
+    기존 URL 과의 차이만 일괄 INSERT/DELETE 하므로 그대로인 이미지는 id 와 변형 이미지가 유지된다.
+    같은 URL 을 여러 번 보낸 경우도 개수대로 맞춘다.
+    """
+    wanted = Counter(image_urls)
+    removed_ids = []
+    for image_id, image_url in await db.execute(
+        select(ReviewImage.id, ReviewImage.image_url)
+        .where(ReviewImage.review_id == review_id)
+        .order_by(ReviewImage.id)
+    ):
+        if wanted[image_url] > 0:
+            wanted[image_url] -= 1
+        else:
+            removed_ids.append(image_id)
+    
+    if removed_ids:
+        await db.execute(delete(ReviewImage).where(ReviewImage.id.in_(removed_ids)))
+    
+    # 요청 순서대로 추가 (기존 이미지 뒤에 id 순으로 붙음)
+    added = []
+    for image_url in image_urls:
+        if wanted[image_url] > 0:
+            wanted[image_url] -= 1
+            added.append({"review_id": review_id, "image_url": image_url})
+    if added:
+        await db.execute(insert(ReviewImage), added)
+    
+    return len(added)
 
 @router.delete("/{review_id}")
 async def delete_review(
     review_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """리뷰 삭제"""
-    review = db.query(Review).filter(
-        Review.id == review_id,
-        Review.user_id == current_user.id
-    ).first()
+    review = (await db.execute(
+        select(Review).options(selectinload(Review.images)).where(
+            Review.id == review_id,
+            Review.user_id == current_user.id
+        )
+    )).scalars().first()
     
     if not review:
         raise HTTPException(
@@ -351,75 +1038,658 @@ async def delete_review(
         )
     
     hospital_id = review.hospital_id
-    db.delete(review)
+    await db.delete(review)
     
     # 병원 평균 평점 업데이트
-    update_hospital_rating(db, hospital_id)
+    await db.run_sync(apply_hospital_rating_delta, hospital_id, removed=review.rating)
     
-    db.commit()
+    await db.commit()
+    await statistics_cache.invalidate_hospital_async(hospital_id)
+    await primary_stickiness.mark_write(user_id=current_user.id, hospital_id=hospital_id)
     
     return {"message": "리뷰가 삭제되었습니다."}
 
+REVIEWABLE_DAYS = 30
+
+def reviewability(reservation: Optional[Reservation], review_id: Optional[int], now: datetime) -> dict:
+    """예약 1건의 리뷰 작성 가능 여부 판정 (조회 결과만 사용, 추가 쿼리 없음)"""
+    if not reservation:
+        return {"reviewable": False, "reason": "예약을 찾을 수 없습니다."}
+    
+    if reservation.status != ReservationStatus.COMPLETED:
+        return {"reviewable": False, "reason": "완료된 예약만 리뷰를 작성할 수 있습니다."}
+    
+    if review_id is not None:
+        return {"reviewable": False, "reason": "이미 리뷰를 작성하셨습니다."}
+    
+    if now - reservation.reservation_date > timedelta(days=REVIEWABLE_DAYS):
+        return {"reviewable": False, "reason": "예약 완료 후 30일이 지났습니다."}
+    
+    return {"reviewable": True}
+
+async def load_reviewable_candidates(
+    db: AsyncSession,
+    user_id: int,
+    reservation_ids: Optional[List[int]] = None
+) -> list:
+    """내 예약과 기존 리뷰 id 를 LEFT JOIN 한 번으로 조회해 [(예약, 리뷰 id 또는 None)] 반환
+    
+    reservation_ids 가 없으면 최근 30일 내 완료된 예약 전체 (예약일 최신순).
+    """
+    query = (
+        select(Reservation, Review.id)
+        .outerjoin(Review, Review.reservation_id == Reservation.id)
+        .where(Reservation.user_id == user_id)
+    )
+    if reservation_ids is not None:
+        query = query.where(Reservation.id.in_(reservation_ids))
+    else:
+        query = query.where(
+            Reservation.status == ReservationStatus.COMPLETED,
+            Reservation.reservation_date >= datetime.utcnow() - timedelta(days=REVIEWABLE_DAYS)
+        ).order_by(Reservation.reservation_date.desc(), Reservation.id.desc())
+    
+    return (await db.execute(query)).all()
+
+@router.post("/check-reviewable", response_model=ReviewableCheckResponse)
+async def check_reviewable_batch(
+    request: ReviewableCheckRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db_for_user)
+):
+    """여러 예약의 리뷰 작성 가능 여부 일괄 확인 (마이페이지용, 쿼리 1회)"""
+    rows = await load_reviewable_candidates(db, current_user.id, request.reservation_ids)
+    now = datetime.utcnow()
+    
+    if request.reservation_ids is None:
+        candidates = [(reservation.id, reservation, review_id) for reservation, review_id in rows]
+    else:
+        # 요청한 순서대로, 없거나 내 것이 아닌 예약은 "찾을 수 없음"
+        found = {reservation.id: (reservation, review_id) for reservation, review_id in rows}
+        candidates = [
+            (reservation_id, *found.get(reservation_id, (None, None)))
+            for reservation_id in dict.fromkeys(request.reservation_ids)
+        ]
+    
+    return {
+        "results": [
+            {"reservation_id": reservation_id, **reviewability(reservation, review_id, now)}
+            for reservation_id, reservation, review_id in candidates
+        ]
+    }
+
 @router.get("/check-reviewable/{reservation_id}")
 async def check_reviewable(
     reservation_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db_for_user)
 ):
-    """리뷰 작성 가능 여부 확인"""
-    # 예약 확인
-    reservation = db.query(Reservation).filter(
-        Reservation.id == reservation_id,
-        Reservation.user_id == current_user.id
-    ).first()
+    """리뷰 작성 가능 여부 확인 (단건, 일괄 확인과 같은 판정 사용)"""
+    rows = await load_reviewable_candidates(db, current_user.id, [reservation_id])
+    reservation, review_id = rows[0] if rows else (None, None)
     
-    if not reservation:
-        return {"reviewable": False, "reason": "예약을 찾을 수 없습니다."}
+    result = reviewability(reservation, review_id, datetime.utcnow())
+    if result["reviewable"]:
+        result["reservation"] = reservation
     
-    if reservation.status != ReservationStatus.COMPLETED:
-        return {"reviewable": False, "reason": "완료된 예약만 리뷰를 작성할 수 있습니다."}
+    return result
+
+# scripts/reconcile_hospital_ratings.py
+from app.database import SessionLocal
+from app.services.hospital_rating import reconcile_hospital_ratings
+
+def main():
+    """병원 평점 집계 정합성 검사 (cron 등으로 주기 실행, 예: 매일 새벽)
     
-    # 기존 리뷰 확인
-    existing_review = db.query(Review).filter(
-        Review.reservation_id == reservation_id
-    ).first()
+    사용법: python -m scripts.reconcile_hospital_ratings
+    """
+    db = SessionLocal()
+    try:
+        repaired = reconcile_hospital_ratings(db)
+        print(f"{repaired}개 병원의 평점 집계를 복구했습니다.")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
+
+# scripts/bench_review_serialization.py
+from datetime import datetime, timedelta
+import timeit
+from pydantic_core import to_json
+from app.schemas.review import ReviewResponse, ReviewListResponse
+from app.services.hospital_rating import build_rating_distribution
+
+def build_page(size: int = 100, images_per_review: int = 3) -> list:
+    """리뷰 목록 한 페이지 분량의 컬럼 조회 결과를 흉내낸 dict 목록 (DB 불필요)"""
+    now = datetime.utcnow()
+    page = []
+    for i in range(size):
+        created_at = now - timedelta(minutes=i)
+        page.append({
+            "id": i,
+            "reservation_id": 10_000 + i,
+            "user_id": 500 + i,
+            "hospital_id": 1,
+            "rating": 1.0 + (i % 9) * 0.5,
+            "comment": "친절하고 대기 시간이 짧았습니다. " * 5,
+            "is_verified": True,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "user_name": f"사용자{i}",
+            "images": [
+                {
+                    "image_url": f"https://cdn.example.com/reviews/{i}/{j}.jpg",
+                    "id": i * 10 + j,
+                    "created_at": created_at,
+                    "variants": {
+                        format: {str(width): f"/media/review-images/{i * 10 + j}/w{width}.{format}" for width in (320, 960)}
+                        for format in ("webp", "avif")
+                    }
+                }
+                for j in range(images_per_review)
+            ],
+        })
+    return page
+
+def serialize_validated(page: list) -> bytes:
+    """기존 경로: 행마다 ReviewResponse 생성 후 response_model 로 목록 전체를 다시 검증해 직렬화"""
+    response = ReviewListResponse(
+        reviews=[ReviewResponse(**review) for review in page],
+        total_count=len(page),
+        next_cursor=None,
+        average_rating=4.2,
+        rating_distribution=build_rating_distribution(None)
+    )
+    validated = ReviewListResponse.model_validate(response.model_dump())
+    return validated.model_dump_json().encode("utf-8")
+
+def serialize_direct(page: list) -> bytes:
+    """새 경로: 컬럼 조회 결과를 검증 없이 JSON 바이트로 한 번 직렬화"""
+    return to_json({
+        "reviews": page,
+        "total_count": len(page),
+        "next_cursor": None,
+        "average_rating": 4.2,
+        "rating_distribution": build_rating_distribution(None)
+    })
+
+def main():
+    """병원 리뷰 목록 100건 페이지의 직렬화 비용 비교
     
-    if existing_review:
-        return {"reviewable": False, "reason": "이미 리뷰를 작성하셨습니다."}
+    사용법: python -m scripts.bench_review_serialization
+    """
+    page = build_page()
+    number = 200
+    for name, serialize in (("validated", serialize_validated), ("direct", serialize_direct)):
+        best = min(timeit.repeat(lambda: serialize(page), number=number, repeat=5))
+        print(f"{name:>9}: {best / number * 1000:.3f} ms/page ({len(serialize(page))} bytes)")
+
+if __name__ == "__main__":
+    main()
+
+# scripts/bench_review_pagination.py
+import argparse
+import statistics
+import time
+from sqlalchemy import text
+from app.api.v1.endpoints.review import (
+    REVIEW_SORT_ORDERS,
+    decode_cursor,
+    hospital_reviews_query,
+    review_cursor
+)
+from app.database import SessionLocal
+
+def seed_reviews(db, hospital_id: int, count: int):
+    """병원에 가짜 리뷰 count 건 추가 (기존 사용자 최대 1000명에게 분배, 최근 3년에 고르게 분포)"""
+    db.execute(text("""
+        WITH authors AS (
+            SELECT array_agg(id) AS ids FROM (SELECT id FROM users ORDER BY id LIMIT 1000) AS u
+        )
+        INSERT INTO reviews (user_id, hospital_id, rating, comment, is_verified, created_at, updated_at)
+        SELECT ids[1 + g % array_length(ids, 1)], :hospital_id, 1 + (g % 9) * 0.5, '벤치마크 리뷰 ' || g, true,
+               now() - (g % 1095) * interval '1 day' - (g % 86400) * interval '1 second',
+               now() - (g % 1095) * interval '1 day'
+        FROM authors, generate_series(1, :count) AS g
+    """), {"hospital_id": hospital_id, "count": count})
+    db.commit()
+    db.execute(text("ANALYZE reviews"))
+    db.commit()
+
+def time_query(db, query, repeat: int) -> dict:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        db.execute(query).all()
+        durations.append(time.perf_counter() - started)
+    durations.sort()
+    return {
+        "median_ms": statistics.median(durations) * 1000,
+        "p95_ms": durations[min(int(len(durations) * 0.95), len(durations) - 1)] * 1000
+    }
+
+def main():
+    """리뷰 목록 1페이지 / 깊은 페이지 응답 시간 비교 (OFFSET vs 커서)
     
-    # 30일 경과 확인
-    if datetime.utcnow() - reservation.reservation_date > timedelta(days=30):
-        return {"reviewable": False, "reason": "예약 완료 후 30일이 지났습니다."}
+    리뷰 100만 건 병원에서 정렬별로 1페이지, --page 페이지(OFFSET), 같은 위치의 커서 페이지를 잰다.
+    --seed 는 리뷰를 실제로 추가하므로 벤치마크 전용 DB 에서만 사용한다.
+    
+    사용법: python -m scripts.bench_review_pagination --hospital-id 1 [--seed 1000000] [--page 5000] [--limit 20]
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hospital-id", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0, help="추가할 가짜 리뷰 수 (벤치마크 DB 전용)")
+    parser.add_argument("--page", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        if args.seed:
+            seed_reviews(db, args.hospital_id, args.seed)
+        total = db.execute(
+            text("SELECT count(*) FROM reviews WHERE hospital_id = :hospital_id"), {"hospital_id": args.hospital_id}
+        ).scalar_one()
+        offset = (args.page - 1) * args.limit
+        print(f"병원 {args.hospital_id}: 리뷰 {total:,}건, 페이지당 {args.limit}건, {args.page}페이지 (OFFSET {offset:,})")
+        
+        for sort_by in REVIEW_SORT_ORDERS:
+            query = hospital_reviews_query(args.hospital_id, sort_by)
+            # 커서 페이지 기준 위치 = 이전 페이지 마지막 행
+            anchor = db.execute(query.offset(offset - 1).limit(1)).first()
+            if anchor is None:
+                print(f"{sort_by}: 리뷰가 {args.page}페이지보다 적습니다.")
+                continue
+            position = decode_cursor(review_cursor(sort_by, anchor))
+            
+            cases = [
+                ("1페이지", query.limit(args.limit + 1)),
+                (f"{args.page}페이지 OFFSET", query.offset(offset).limit(args.limit + 1)),
+                (f"{args.page}페이지 커서", hospital_reviews_query(args.hospital_id, sort_by, None, position).limit(args.limit + 1)),
+            ]
+            for name, case_query in cases:
+                result = time_query(db, case_query, args.repeat)
+                print(f"{sort_by:>11} {name:>14}: median {result['median_ms']:8.2f} ms, p95 {result['p95_ms']:8.2f} ms")
+            db.commit()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
+
+# tests/test_query_plans.py
+from datetime import date, timedelta
+import json
+import os
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.api.v1.endpoints.payment import settled_payments_query
+from app.api.v1.endpoints.review import (
+    REVIEW_SORT_ORDERS,
+    decode_cursor,
+    hospital_reviews_query,
+    my_reviews_query,
+    review_cursor
+)
+from app.api.v1.endpoints.statistics import reservation_bucket_query, reservation_kpi_query
+from app.database import Base
+from app.models.payment import Payment
+from app.models.reservation import Reservation
+
+# 핫 쿼리가 순차 스캔으로 떨어지지 않는지 실제 데이터 분포에서 확인 (TEST_DATABASE_URL 필요)
+# 데이터가 작으면 플래너가 순차 스캔을 고르므로 병원당 수천 건 이상으로 채운다
+PLAN_RESERVATIONS = int(os.environ.get("PLAN_RESERVATIONS", "200000"))
+PLAN_HOSPITALS = 20
+PLAN_USERS = 20000
+PAGE_SIZE = 20
+
+@pytest.fixture(scope="module")
+def plan_db(pg_engine):
+    """실행 계획 확인용 데이터 (예약 / 리뷰 절반 / 결제 1건씩, 최근 2년에 분포) 를 채우고 통계 갱신"""
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)  # pg_engine 이 모든 모델을 등록해 둠
+    reservation_status = Reservation.__table__.c.status.type.name
+    payment_status = Payment.__table__.c.status.type.name
+    
+    with pg_engine.begin() as conn:
+        conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        conn.execute(text("""
+            INSERT INTO users (id, email, name)
+            SELECT g, 'user' || g || '@example.com', '사용자' || g
+            FROM generate_series(1, :count) AS g
+        """), {"count": PLAN_USERS})
+        conn.execute(text("""
+            INSERT INTO hospitals (id, name, admin_id, average_rating, review_count, rating_sum, rating_histogram)
+            SELECT g, '병원' || g, 1, 0, 0, 0, array_fill(0, ARRAY[9])
+            FROM generate_series(1, :count) AS g
+        """), {"count": PLAN_HOSPITALS})
+        conn.execute(text(f"""
+            INSERT INTO reservations (id, user_id, hospital_id, reservation_date, time_slot, status, created_at, updated_at, version)
+            SELECT g, 1 + (g * 7919) % :users, 1 + g % :hospitals, d, '10:00',
+                   (ARRAY['PENDING', 'CONFIRMED', 'CANCELLED', 'COMPLETED', 'NO_SHOW'])[1 + g % 5]::{reservation_status},
+                   d - (g % 30) * interval '1 day', d, 1
+            FROM generate_series(1, :count) AS g,
+                 LATERAL (SELECT CAST(:today AS timestamp) - (g % 730) * interval '1 day' + (g % 10) * interval '1 hour') AS r(d)
+        """), {"users": PLAN_USERS, "hospitals": PLAN_HOSPITALS, "count": PLAN_RESERVATIONS, "today": date.today()})
+        conn.execute(text("""
+            INSERT INTO reviews (reservation_id, user_id, hospital_id, rating, comment, is_verified, created_at, updated_at)
+            SELECT id, user_id, hospital_id, 1 + (id % 9) * 0.5, '리뷰 ' || id, true,
+                   reservation_date + interval '1 day', reservation_date + interval '1 day'
+            FROM reservations WHERE id % 2 = 0
+        """))
+        conn.execute(text(f"""
+            INSERT INTO payments (reservation_id, tid, amount, status, created_at, updated_at, version)
+            SELECT id, 'T' || id, 50000,
+                   (ARRAY['PENDING', 'COMPLETED', 'FAILED', 'CANCELLED', 'REFUNDED'])[1 + id % 5]::{payment_status},
+                   created_at, created_at, 1
+            FROM reservations
+        """))
+        for table in ("users", "hospitals", "reservations", "reviews", "payments"):
+            conn.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))"))
+    
+    # Index Only Scan 이 가능하도록 가시성 맵까지 갱신 (VACUUM 은 트랜잭션 밖에서만 가능)
+    with pg_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE"))
+    return pg_engine
+
+def explain(conn, statement) -> dict:
+    """statement 를 앱과 같은 방식으로 바인딩해 EXPLAIN (FORMAT JSON) 한 최상위 Plan 노드"""
+    def prefix_explain(conn, cursor, sql, parameters, context, executemany):
+        return "EXPLAIN (FORMAT JSON) " + sql, parameters
+    
+    event.listen(conn, "before_cursor_execute", prefix_explain, retval=True)
+    try:
+        result = conn.execute(statement)
+        plan = result.cursor.fetchone()[0]
+        result.close()
+    finally:
+        event.remove(conn, "before_cursor_execute", prefix_explain)
+    
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+def seq_scans(plan: dict) -> list:
+    return [node.get("Relation Name") for node in plan_nodes(plan) if node["Node Type"] == "Seq Scan"]
+
+def next_position(conn, sort_by: str, query) -> dict:
+    """첫 페이지 마지막 행의 커서 위치 (커서 페이지 쿼리용)"""
+    rows = conn.execute(query.limit(PAGE_SIZE)).all()
+    return decode_cursor(review_cursor(sort_by, rows[-1]))
+
+def hot_queries(conn) -> dict:
+    """API 가 실행하는 형태 그대로의 핫 쿼리 {이름: statement}"""
+    session = Session(bind=conn)
+    today = date.today()
+    hospital_id = 3
+    user_id = conn.execute(text("SELECT user_id FROM reviews GROUP BY user_id ORDER BY count(*) DESC LIMIT 1")).scalar_one()
+    reservation_id = conn.execute(text("SELECT reservation_id FROM payments ORDER BY id DESC LIMIT 1")).scalar_one()
+    
+    queries = {}
+    for sort_by in REVIEW_SORT_ORDERS:
+        first_page = hospital_reviews_query(hospital_id, sort_by)
+        queries[f"hospital_reviews_{sort_by}"] = first_page.limit(PAGE_SIZE + 1)
+        position = next_position(conn, sort_by, first_page)
+        queries[f"hospital_reviews_{sort_by}_cursor"] = (
+            hospital_reviews_query(hospital_id, sort_by, None, position).limit(PAGE_SIZE + 1)
+        )
+    queries["hospital_reviews_rating_filter"] = hospital_reviews_query(hospital_id, "recent", 4.5).limit(PAGE_SIZE + 1)
+    
+    my_first_page = my_reviews_query(user_id)
+    queries["my_reviews"] = my_first_page.limit(PAGE_SIZE + 1)
+    queries["my_reviews_cursor"] = (
+        my_reviews_query(user_id, next_position(conn, "recent", my_first_page)).limit(PAGE_SIZE + 1)
+    )
+    
+    queries["dashboard_reservations"] = reservation_kpi_query(session, hospital_id, today).statement
+    queries["period_reservation_buckets"] = (
+        reservation_bucket_query(session, hospital_id, today - timedelta(days=29), today).statement
+    )
+    
+    queries["payments_by_reservation_status"] = settled_payments_query(reservation_id)
+    return queries
+
+def test_hot_queries_do_not_seq_scan(plan_db):
+    with plan_db.connect() as conn:
+        failures = {}
+        for name, statement in hot_queries(conn).items():
+            plan = explain(conn, statement)
+            if seq_scans(plan):
+                failures[name] = json.dumps(plan, ensure_ascii=False, indent=2)
+    
+    assert not failures, "순차 스캔이 포함된 실행 계획:\n" + "\n".join(
+        f"[{name}]\n{plan}" for name, plan in failures.items()
+    )
+
+RANGE_SCAN_NODES = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+@pytest.mark.parametrize("name", ["dashboard_reservations", "period_reservation_buckets"])
+def test_reservation_date_queries_range_scan_hospital_date_index(plan_db, name):
+    """예약일 기준 집계는 (hospital_id, reservation_date) 인덱스 범위 검색이어야 함"""
+    with plan_db.connect() as conn:
+        plan = explain(conn, hot_queries(conn)[name])
     
-    return {"reviewable": True, "reservation": reservation}
+    range_scans = [
+        node for node in plan_nodes(plan)
+        if node["Node Type"] in RANGE_SCAN_NODES
+        and node.get("Index Name") == "ix_reservations_hospital_reservation_date"
+        and "reservation_date" in node.get("Index Cond", "")
+    ]
+    assert range_scans, json.dumps(plan, ensure_ascii=False, indent=2)
+
+# alembic/versions/20261017_0002_hospital_rating_aggregates.py
+"""병원 평점 증분 집계 컬럼 추가 (평점 합계, 0.5 단위 분포)
+
+Revision ID: 20261017_0002
+Revises: 20261017_0001
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
-def update_hospital_rating(db: Session, hospital_id: int):
-    """병원 평균 평점 업데이트"""
-    avg_rating = db.query(func.avg(Review.rating)).filter(
-        Review.hospital_id == hospital_id
-    ).scalar()
+revision = "20261017_0002"
+down_revision = "20261017_0001"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column("hospitals", sa.Column("rating_sum", sa.Float(), nullable=False, server_default="0"))
+    op.add_column(
+        "hospitals",
+        sa.Column(
+            "rating_histogram",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+            server_default="{0,0,0,0,0,0,0,0,0}"
+        )
+    )
     
-    review_count = db.query(func.count(Review.id)).filter(
-        Review.hospital_id == hospital_id
-    ).scalar()
+    # 기존 리뷰로 초기값 계산 (0.5 단위가 아닌 평점은 rating_bucket_index 와 같이 가장 가까운 버킷으로)
+    bucket = "LEAST(GREATEST(ROUND(((rating - 1.0) * 2)::numeric), 0), 8)"
+    buckets = ", ".join(
+        f"COUNT(*) FILTER (WHERE {bucket} = {i})" for i in range(9)
+    )
+    op.execute(f"""
+        UPDATE hospitals h
+        SET rating_sum = s.rating_sum,
+            review_count = s.review_count,
+            average_rating = ROUND((s.rating_sum / s.review_count)::numeric, 1),
+            rating_histogram = s.rating_histogram
+        FROM (
+            SELECT hospital_id,
+                   SUM(rating) AS rating_sum,
+                   COUNT(*) AS review_count,
+                   ARRAY[{buckets}] AS rating_histogram
+            FROM reviews
+            GROUP BY hospital_id
+        ) s
+        WHERE h.id = s.hospital_id
+    """)
+
+def downgrade():
+    op.drop_column("hospitals", "rating_histogram")
+    op.drop_column("hospitals", "rating_sum")
+
+# alembic/versions/20261017_0003_hot_query_indexes.py
+"""리뷰/결제/예약 조회용 복합 인덱스 추가
+
+Revision ID: 20261017_0003
+Revises: 20261017_0002
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0003"
+down_revision = "20261017_0002"
+branch_labels = None
+depends_on = None
+
+# (이름, 테이블, 컬럼, INCLUDE 컬럼)
+INDEXES = [
+    ("ix_reviews_hospital_created_at", "reviews", [sa.text("hospital_id"), sa.text("created_at DESC"), sa.text("id DESC")], None),
+    ("ix_reviews_hospital_rating_created_at", "reviews", ["hospital_id", "rating", "created_at", "id"], None),
+    ("ix_reviews_user_created_at", "reviews", [sa.text("user_id"), sa.text("created_at DESC"), sa.text("id DESC")], None),
+    ("ix_review_images_review_id", "review_images", ["review_id"], None),
+    ("ix_payments_reservation_status_created_at", "payments", ["reservation_id", "status", "created_at"], None),
+    ("ix_payments_created_at", "payments", ["created_at"], ["reservation_id", "status", "amount"]),
+    ("ix_reservations_hospital_reservation_date", "reservations", ["hospital_id", "reservation_date"], ["status", "time_slot", "service_id"]),
+    ("ix_reservations_hospital_created_at", "reservations", ["hospital_id", "created_at"], ["status", "user_id"]),
+]
+
+def upgrade():
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY 로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_include=include or [],
+                if_not_exists=True
+            )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+# alembic/versions/20261017_0008_review_image_variants.py
+"""리뷰 이미지 변형 (WebP/AVIF 리사이즈) 컬럼 추가
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0008"
+down_revision = "20261017_0007"
+branch_labels = None
+depends_on = None
+
+variant_status = sa.Enum("PENDING", "PROCESSING", "READY", "FAILED", name="reviewimagevariantstatus")
+
+def upgrade():
+    variant_status.create(op.get_bind(), checkfirst=True)
+    op.add_column("review_images", sa.Column("variants", sa.JSON()))
+    # 기존 이미지도 PENDING 으로 시작해 파이프라인이 배치 단위로 변형을 채운다
+    op.add_column("review_images", sa.Column("variant_status", variant_status, nullable=False, server_default="PENDING"))
+    op.add_column("review_images", sa.Column("variant_attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("review_images", sa.Column("variant_available_at", sa.DateTime(), server_default=sa.func.now()))
+    op.add_column("review_images", sa.Column("variant_error", sa.Text()))
     
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if hospital:
-        hospital.average_rating = round(avg_rating, 1) if avg_rating else 0
-        hospital.review_count = review_count or 0
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_review_images_variant_pending",
+            "review_images",
+            ["variant_available_at"],
+            postgresql_where=sa.text("variant_status IN ('PENDING', 'PROCESSING')"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_review_images_variant_pending",
+            table_name="review_images",
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+    op.drop_column("review_images", "variant_error")
+    op.drop_column("review_images", "variant_available_at")
+    op.drop_column("review_images", "variant_attempts")
+    op.drop_column("review_images", "variant_status")
+    op.drop_column("review_images", "variants")
+    variant_status.drop(op.get_bind(), checkfirst=True)
+
+# alembic/versions/20261017_0010_reviews_rating_low_index.py
+"""리뷰 평점 낮은순 정렬용 인덱스 추가
+
+rating ASC, created_at DESC, id DESC 정렬은 (hospital_id, rating, created_at, id) 인덱스를
+어느 방향으로 읽어도 맞지 않아 평점 그룹마다 정렬이 필요했다.
+
+Revision ID: 20261017_0010
+Revises: 20261017_0008
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0010"
+down_revision = "20261017_0008"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_reviews_hospital_rating_low",
+            "reviews",
+            [sa.text("hospital_id"), sa.text("rating"), sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_reviews_hospital_rating_low",
+            table_name="reviews",
+            postgresql_concurrently=True,
+            if_exists=True
+        )
 
 # main.py에 라우터 추가
 from app.api.v1.endpoints import review
+from app.services.review_images import review_image_pipeline
 
 app.include_router(review.router, prefix="/api/v1/reviews", tags=["reviews"])
+app.add_event_handler("startup", review_image_pipeline.start)
+app.add_event_handler("shutdown", review_image_pipeline.stop)
 
 # Hospital 모델에 추가 (models/hospital.py)
 # average_rating = Column(Float, default=0)
 # review_count = Column(Integer, default=0)
+# rating_sum = Column(Float, nullable=False, default=0)
+# rating_histogram = Column(ARRAY(Integer), nullable=False, default=lambda: [0] * 9)  # 1.0 ~ 5.0, 0.5 단위
 # reviews = relationship("Review", back_populates="hospital")
 
 # User 모델에 추가 (models/user.py)
 # reviews = relationship("Review", back_populates="user")
 
 # Reservation 모델에 추가 (models/reservation.py)
-# review = relationship("Review", back_populates="reservation", uselist=False)
\ No newline at end of file
+# review = relationship("Review", back_populates="reservation", uselist=False)
+# __table_args__ = (
+#     Index("ix_reservations_hospital_reservation_date", hospital_id, reservation_date,
+#           postgresql_include=["status", "time_slot", "service_id"]),
+#     Index("ix_reservations_hospital_created_at", hospital_id, created_at,
+#           postgresql_include=["status", "user_id"]),
+# )
\ No newline at end of file
@@ -1,3 +1,48 @@
+# app/models/statistics.py
+from sqlalchemy import Column, Integer, Float, Date, DateTime, ForeignKey
+from app.database import Base
+from datetime import datetime
+
+class HospitalDailyStats(Base):
+    """병원별 일간 매출 집계 (결제 생성/상태 변경 시 증분 갱신)
+    
+    예약 생성/확정/완료/노쇼는 이 API 밖의 예약 서비스에서 기록되므로 예약 지표는
+    집계하지 않고 reservations 테이블의 (hospital_id, reservation_date) 인덱스로 직접 계산한다.
+    """
+    __tablename__ = "hospital_daily_stats"
+    
+    hospital_id = Column(Integer, ForeignKey("hospitals.id"), primary_key=True)
+    stat_date = Column(Date, primary_key=True)
+    
+    # 결제 (결제 생성일 기준)
+    payment_count = Column(Integer, nullable=False, default=0)
+    completed_amount = Column(Float, nullable=False, default=0)
+    refunded_amount = Column(Float, nullable=False, default=0)
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# app/utils/date_range.py
+from sqlalchemy import and_, true
+from datetime import date, timedelta
+from typing import Optional
+
+def date_range(column, start: Optional[date] = None, end: Optional[date] = None):
+    """날짜/일시 컬럼의 [start, end 다음 날 0시) 반열림 구간 조건 (None 경계는 제한 없음)
+    
+    func.date(column) == 날짜 처럼 컬럼을 함수로 감싸면 인덱스를 쓰지 못하고,
+    column <= end 는 종료일 0시 이후 기록을 빠뜨리므로 두 경우 모두 이 조건으로 대체한다.
+    """
+    conditions = []
+    if start is not None:
+        conditions.append(column >= start)
+    if end is not None:
+        conditions.append(column < end + timedelta(days=1))
+    return and_(true(), *conditions)
+
+def on_date(column, day: date):
+    """특정 날짜 하루 조건"""
+    return date_range(column, day, day)
+
 # app/schemas/statistics.py
 from pydantic import BaseModel
 from datetime import datetime, date
@@ -70,21 +115,872 @@ class PeriodStatistics(BaseModel):
     average_daily_reservations: float
     average_daily_revenue: float
 
-# app/api/v1/endpoints/statistics.py
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+class ExportJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class ExportJob(BaseModel):
+    job_id: str
+    hospital_id: int
+    user_id: int
+    format: str
+    start_date: date
+    end_date: date
+    status: ExportJobStatus
+    rows_done: int = 0
+    rows_total: Optional[int] = None
+    filename: str
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+class ExportJobResponse(BaseModel):
+    job_id: str
+    hospital_id: int
+    format: str
+    status: ExportJobStatus
+    rows_done: int
+    rows_total: Optional[int]
+    progress: float  # %
+    error: Optional[str]
+    created_at: datetime
+    finished_at: Optional[datetime]
+    download_url: Optional[str]
+
+# app/services/statistics_rollup.py
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, case, extract
+from sqlalchemy import func, case, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import datetime, date
+from typing import Optional
+from app.models.statistics import HospitalDailyStats
+from app.models.reservation import Reservation
+from app.models.payment import Payment, PaymentStatus
+from app.utils.date_range import date_range
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 환불 요청 중인 결제는 환불이 확정될 때까지 완료 금액에 포함
+PAYMENT_AMOUNT_COLUMNS = {
+    PaymentStatus.COMPLETED: "completed_amount",
+    PaymentStatus.REFUNDING: "completed_amount",
+    PaymentStatus.REFUNDED: "refunded_amount",
+}
+
+COUNTER_COLUMNS = (
+    "payment_count",
+    "completed_amount",
+    "refunded_amount",
+)
+
+def apply_daily_stats_delta(db: Session, hospital_id: int, stat_date: date, **deltas):
+    """일간 집계 행에 증감분 반영 (행이 없으면 생성)"""
+    deltas = {column: value for column, value in deltas.items() if value}
+    if not deltas:
+        return
+    
+    table = HospitalDailyStats.__table__
+    stmt = pg_insert(table).values(hospital_id=hospital_id, stat_date=stat_date, **deltas)
+    set_ = {column: table.c[column] + stmt.excluded[column] for column in deltas}
+    set_["updated_at"] = func.now()
+    
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.hospital_id, table.c.stat_date],
+        set_=set_
+    ))
+
+def payment_status_deltas(
+    old_status: Optional[PaymentStatus],
+    new_status: Optional[PaymentStatus],
+    amount: Optional[float]
+) -> dict:
+    """결제 상태 변경에 따른 집계 증감 (완료/환불 금액 이동)"""
+    deltas = {}
+    if old_status == new_status:
+        return deltas
+    amount = amount or 0
+    if old_status in PAYMENT_AMOUNT_COLUMNS:
+        deltas[PAYMENT_AMOUNT_COLUMNS[old_status]] = -amount
+    if new_status in PAYMENT_AMOUNT_COLUMNS:
+        column = PAYMENT_AMOUNT_COLUMNS[new_status]
+        deltas[column] = deltas.get(column, 0) + amount
+    return deltas
+
+def record_payment_created(db: Session, payment: Payment, hospital_id: int):
+    """결제 생성 반영 (flush 이후 호출)"""
+    deltas = {"payment_count": 1}
+    amount_column = PAYMENT_AMOUNT_COLUMNS.get(payment.status)
+    if amount_column:
+        deltas[amount_column] = payment.amount or 0
+    apply_daily_stats_delta(db, hospital_id, (payment.created_at or datetime.utcnow()).date(), **deltas)
+
+def rebuild_hospital_daily_stats(
+    db: Session,
+    hospital_id: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    batch_size: int = 1000
+) -> int:
+    """원본 테이블로부터 일간 집계 재계산 (백필/드리프트 복구용), 생성된 행 수 반환
+    
+    재계산 중 반영된 증분이 삭제/재생성으로 사라지지 않도록 집계 테이블을 SHARE ROW EXCLUSIVE 로 잠근다.
+    잠금은 호출한 쪽이 커밋할 때까지 증분 갱신 (결제 승인/환불) 을 막으므로 병원 단위로 나눠 호출하고 바로 커밋한다.
+    """
+    # 조회보다 먼저 잠가야 잠금 대기 중 커밋된 변경까지 재계산에 포함된다
+    db.execute(text("LOCK TABLE hospital_daily_stats IN SHARE ROW EXCLUSIVE MODE"))
+    
+    def scoped(query, hospital_column, date_column):
+        if hospital_id is not None:
+            query = query.filter(hospital_column == hospital_id)
+        return query.filter(date_range(date_column, start_date, end_date))
+    
+    # 결제 (결제 생성일 기준)
+    payment_day = func.date(Payment.created_at)
+    payment_query = db.query(
+        Reservation.hospital_id,
+        payment_day,
+        func.count(Payment.id),
+        func.sum(case(
+            (Payment.status.in_([PaymentStatus.COMPLETED, PaymentStatus.REFUNDING]), Payment.amount), else_=0
+        )),
+        func.sum(case((Payment.status == PaymentStatus.REFUNDED, Payment.amount), else_=0))
+    ).join(
+        Reservation, Payment.reservation_id == Reservation.id
+    )
+    payment_query = scoped(payment_query, Reservation.hospital_id, Payment.created_at)
+    values = [
+        {
+            "hospital_id": key_hospital_id,
+            "stat_date": key_date,
+            "payment_count": count,
+            "completed_amount": completed_amount or 0,
+            "refunded_amount": refunded_amount or 0
+        }
+        for key_hospital_id, key_date, count, completed_amount, refunded_amount in payment_query.group_by(
+            Reservation.hospital_id, payment_day
+        )
+    ]
+    
+    # 범위 내 기존 집계 삭제 후 재생성
+    delete_query = scoped(
+        db.query(HospitalDailyStats), HospitalDailyStats.hospital_id, HospitalDailyStats.stat_date
+    )
+    delete_query.delete(synchronize_session=False)
+    
+    for offset in range(0, len(values), batch_size):
+        db.execute(insert(HospitalDailyStats), values[offset:offset + batch_size])
+    
+    logger.info(f"일간 통계 재계산 완료: hospital_id={hospital_id}, rows={len(values)}")
+    return len(values)
+
+# app/core/cache.py
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel
+from app.core.config import settings
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+class CacheBackend:
+    """캐시 백엔드 인터페이스"""
+    
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+    
+    def set(self, key: str, value: str, ttl: int):
+        raise NotImplementedError
+    
+    def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+    
+    def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+class InMemoryLRUCache(CacheBackend):
+    """프로세스 내 LRU 캐시 (워커별로 독립)"""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (value, expires_at)
+        self._counters = {}  # 무효화 버전은 LRU 제거 대상에서 제외
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str, ttl: int):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+    
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+def decode_value(value) -> Optional[str]:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+class RedisCache(CacheBackend):
+    """Redis 호환 캐시 (redis.Redis 또는 동일 인터페이스의 클라이언트)"""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    def get(self, key: str) -> Optional[str]:
+        return decode_value(self.client.get(key))
+    
+    def set(self, key: str, value: str, ttl: int):
+        self.client.set(key, value, ex=ttl)
+    
+    def get_counter(self, key: str) -> int:
+        return int(self.client.get(key) or 0)
+    
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(key))
+
+class AsyncCacheBackend:
+    """비동기 캐시 백엔드 인터페이스 (이벤트 루프에서 호출)"""
+    
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: str, ttl: int):
+        raise NotImplementedError
+    
+    async def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+    
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+class InMemoryAsyncCache(AsyncCacheBackend):
+    """프로세스 내 LRU 캐시의 비동기 인터페이스 (I/O 가 없어 루프를 막지 않음)"""
+    
+    def __init__(self, backend: InMemoryLRUCache):
+        self.backend = backend
+    
+    async def get(self, key: str) -> Optional[str]:
+        return self.backend.get(key)
+    
+    async def set(self, key: str, value: str, ttl: int):
+        self.backend.set(key, value, ttl)
+    
+    async def get_counter(self, key: str) -> int:
+        return self.backend.get_counter(key)
+    
+    async def incr(self, key: str) -> int:
+        return self.backend.incr(key)
+
+class AsyncRedisCache(AsyncCacheBackend):
+    """redis.asyncio 클라이언트 기반 캐시 (비동기 엔드포인트용)"""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    async def get(self, key: str) -> Optional[str]:
+        return decode_value(await self.client.get(key))
+    
+    async def set(self, key: str, value: str, ttl: int):
+        await self.client.set(key, value, ex=ttl)
+    
+    async def get_counter(self, key: str) -> int:
+        return int(await self.client.get(key) or 0)
+    
+    async def incr(self, key: str) -> int:
+        return int(await self.client.incr(key))
+
+class StatisticsCache:
+    """병원별 통계 응답 캐시 (TTL 만료 + 쓰기 이벤트 시 병원 단위 무효화)
+    
+    무효화는 병원별 버전 카운터를 올리는 방식이라 기존 키를 찾아 지울 필요가 없고,
+    이전 버전 항목은 TTL이 지나면 자연히 사라진다.
+    동기 코드(스레드풀, 배치 작업)는 backend 를, 비동기 엔드포인트는 async_backend 를 쓴다.
+    """
+    
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = 60, async_backend: Optional[AsyncCacheBackend] = None):
+        self.backend = backend
+        self.async_backend = async_backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+    
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    def _version_key(self, hospital_id: int) -> str:
+        return f"stats:{hospital_id}:version"
+    
+    def _key(self, kind: str, hospital_id: int, version: int, params: dict) -> str:
+        param_str = "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+        return f"stats:{hospital_id}:v{version}:{kind}:{param_str}"
+    
+    def _lookup(self, kind: str, hospital_id: int, params: dict) -> Tuple[Optional[str], Optional[str]]:
+        """(캐시 키, 저장된 값) 조회, 캐시 장애 시 키는 None"""
+        try:
+            version = self.backend.get_counter(self._version_key(hospital_id))
+            key = self._key(kind, hospital_id, version, params)
+            cached = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"통계 캐시 조회 실패: {e}")
+            self._count("errors")
+            return None, None
+        
+        self._count("hits" if cached is not None else "misses")
+        return key, cached
+    
+    async def _lookup_async(self, kind: str, hospital_id: int, params: dict) -> Tuple[Optional[str], Optional[str]]:
+        """_lookup 의 비동기 백엔드 버전"""
+        try:
+            version = await self.async_backend.get_counter(self._version_key(hospital_id))
+            key = self._key(kind, hospital_id, version, params)
+            cached = await self.async_backend.get(key)
+        except Exception as e:
+            logger.warning(f"통계 캐시 조회 실패: {e}")
+            self._count("errors")
+            return None, None
+        
+        self._count("hits" if cached is not None else "misses")
+        return key, cached
+    
+    def _store(self, key: Optional[str], result: BaseModel):
+        if key is None:
+            return
+        try:
+            self.backend.set(key, result.model_dump_json(), self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"통계 캐시 저장 실패: {e}")
+            self._count("errors")
+    
+    async def _store_async(self, key: Optional[str], result: BaseModel):
+        if key is None:
+            return
+        try:
+            await self.async_backend.set(key, result.model_dump_json(), self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"통계 캐시 저장 실패: {e}")
+            self._count("errors")
+    
+    def get_or_build(
+        self,
+        model_cls: Type[ModelT],
+        kind: str,
+        hospital_id: int,
+        params: dict,
+        builder: Callable[[], ModelT]
+    ) -> ModelT:
+        """캐시 조회 후 없으면 builder 결과를 저장 (캐시 장애 시 builder로 대체)"""
+        key, cached = self._lookup(kind, hospital_id, params)
+        if cached is not None:
+            return model_cls.model_validate_json(cached)
+        
+        result = builder()
+        self._store(key, result)
+        return result
+    
+    async def get_or_build_async(
+        self,
+        model_cls: Type[ModelT],
+        kind: str,
+        hospital_id: int,
+        params: dict,
+        builder: Callable[[], Awaitable[ModelT]]
+    ) -> ModelT:
+        """get_or_build 의 비동기 버전 (캐시 조회/저장도 async_backend 로 해 이벤트 루프를 막지 않음)"""
+        key, cached = await self._lookup_async(kind, hospital_id, params)
+        if cached is not None:
+            return model_cls.model_validate_json(cached)
+        
+        result = await builder()
+        await self._store_async(key, result)
+        return result
+    
+    def invalidate_hospital(self, hospital_id: int):
+        """병원의 모든 캐시 항목 무효화 (커밋 이후 호출)"""
+        try:
+            self.backend.incr(self._version_key(hospital_id))
+            self._count("invalidations")
+        except Exception as e:
+            logger.warning(f"통계 캐시 무효화 실패: hospital_id={hospital_id}, {e}")
+            self._count("errors")
+    
+    async def invalidate_hospital_async(self, hospital_id: int):
+        """invalidate_hospital 의 비동기 백엔드 버전 (비동기 엔드포인트에서 호출)"""
+        try:
+            await self.async_backend.incr(self._version_key(hospital_id))
+            self._count("invalidations")
+        except Exception as e:
+            logger.warning(f"통계 캐시 무효화 실패: hospital_id={hospital_id}, {e}")
+            self._count("errors")
+    
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 1) if total > 0 else 0,
+            "errors": self.errors,
+            "invalidations": self.invalidations
+        }
+
+def create_statistics_cache() -> StatisticsCache:
+    """설정에 따른 통계 캐시 생성"""
+    if settings.STATS_CACHE_BACKEND == "redis":
+        import redis
+        import redis.asyncio
+        backend = RedisCache(redis.Redis.from_url(settings.REDIS_URL))
+        async_backend = AsyncRedisCache(redis.asyncio.Redis.from_url(settings.REDIS_URL))
+    else:
+        backend = InMemoryLRUCache(settings.STATS_CACHE_MAX_ENTRIES)
+        async_backend = InMemoryAsyncCache(backend)
+    return StatisticsCache(backend, settings.STATS_CACHE_TTL_SECONDS, async_backend)
+
+statistics_cache = create_statistics_cache()
+
+def on_reservation_status_changed(hospital_id: int):
+    """예약 생성/상태 변경 훅 (변경을 커밋한 뒤 호출)
+    
+    예약 지표는 집계 테이블 없이 reservations 에서 직접 계산하므로 캐시 무효화만 하면 된다.
+    예약 서비스(services/reservation.py)와 결제 승인/환불처럼 예약 상태를 바꾸는 곳에서 호출한다.
+    """
+    statistics_cache.invalidate_hospital(hospital_id)
+
+async def on_reservation_status_changed_async(hospital_id: int):
+    """on_reservation_status_changed 의 비동기 버전 (비동기 엔드포인트에서 호출)"""
+    await statistics_cache.invalidate_hospital_async(hospital_id)
+
+# app/services/statistics_export.py
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import Iterable, Iterator, Optional
+from app.database import ReplicaSessionLocal
+from app.schemas.statistics import DashboardSummary, PeriodStatistics
+from app.models.reservation import Reservation
+from app.models.payment import Payment
+from app.models.user import User
+from app.models.medical_service import MedicalService
+from app.utils.date_range import date_range
+import csv
+import io
+
+EXPORT_HEADER = ['예약ID', '예약일시', '시간대', '환자명', '서비스', '예약상태', '결제금액', '결제상태']
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+def build_export_query(db: Session, hospital_id: int, start_date: date, end_date: date):
+    """내보내기 대상 예약 조회 쿼리 (예약 ID 순)"""
+    return db.query(
+        Reservation.id,
+        Reservation.reservation_date,
+        Reservation.time_slot,
+        User.name.label('patient_name'),
+        MedicalService.name.label('service_name'),
+        Reservation.status,
+        Payment.amount,
+        Payment.status.label('payment_status')
+    ).join(
+        User, Reservation.user_id == User.id
+    ).join(
+        MedicalService, Reservation.service_id == MedicalService.id
+    ).outerjoin(
+        Payment, Payment.reservation_id == Reservation.id
+    ).filter(
+        Reservation.hospital_id == hospital_id,
+        date_range(Reservation.reservation_date, start_date, end_date)
+    ).order_by(Reservation.id)
+
+def format_export_row(row) -> list:
+    """조회 행을 내보내기 행으로 변환"""
+    return [
+        row.id,
+        row.reservation_date.strftime('%Y-%m-%d'),
+        row.time_slot,
+        row.patient_name,
+        row.service_name,
+        row.status.value if row.status else '',
+        row.amount or 0,
+        row.payment_status.value if row.payment_status else '미결제'
+    ]
+
+def iter_export_rows(hospital_id: int, start_date: date, end_date: date, batch_size: int = 1000) -> Iterator[list]:
+    """서버 측 커서로 내보내기 행을 batch_size 단위로 가져오며 순차 반환
+    
+    응답 스트리밍이 요청 의존성 세션보다 오래 살아 있으므로 별도 세션(읽기 복제본)을 연다.
+    """
+    db = ReplicaSessionLocal()
+    try:
+        query = build_export_query(db, hospital_id, start_date, end_date).execution_options(
+            stream_results=True
+        ).yield_per(batch_size)
+        for row in query:
+            yield format_export_row(row)
+    finally:
+        db.close()
+
+def iter_csv_chunks(rows: Iterable[list], chunk_rows: int = 500) -> Iterator[str]:
+    """내보내기 행을 CSV 문자열 조각으로 변환 (chunk_rows 행마다 버퍼 비움)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함
+    buffer.write('\ufeff')
+    writer.writerow(EXPORT_HEADER)
+    
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    yield buffer.getvalue()
+
+def write_xlsx_export(
+    path: str,
+    rows: Iterable[list],
+    period_statistics: Optional[PeriodStatistics] = None,
+    dashboard: Optional[DashboardSummary] = None
+) -> int:
+    """xlsx 파일 작성 (write-only 모드로 행을 바로 기록해 메모리 사용량 일정), 예약 행 수 반환"""
+    from openpyxl import Workbook
+    
+    workbook = Workbook(write_only=True)
+    
+    # 예약 내역
+    sheet = workbook.create_sheet("예약내역")
+    sheet.append(EXPORT_HEADER)
+    row_count = 0
+    for row in rows:
+        sheet.append(row)
+        row_count += 1
+    
+    if period_statistics is not None:
+        # 기간별 예약 통계
+        sheet = workbook.create_sheet("기간별 예약")
+        sheet.append(['기간', '전체', '확정', '취소', '완료', '노쇼', '확정률(%)', '취소율(%)', '완료율(%)'])
+        for stat in period_statistics.reservations:
+            sheet.append([
+                stat.period, stat.total_count, stat.confirmed_count, stat.cancelled_count,
+                stat.completed_count, stat.no_show_count, stat.confirmation_rate,
+                stat.cancellation_rate, stat.completion_rate
+            ])
+        
+        # 기간별 매출 통계
+        sheet = workbook.create_sheet("기간별 매출")
+        sheet.append(['기간', '총매출', '결제완료', '환불금액', '순매출', '평균 결제액', '결제 건수'])
+        for stat in period_statistics.revenues:
+            sheet.append([
+                stat.period, stat.total_revenue, stat.completed_payments, stat.refunded_amount,
+                stat.net_revenue, stat.average_payment, stat.payment_count
+            ])
+    
+    if dashboard is not None:
+        # 대시보드 주요 지표
+        sheet = workbook.create_sheet("대시보드")
+        sheet.append(['지표', '값'])
+        for label, value in [
+            ('오늘 예약', dashboard.today_reservations),
+            ('오늘 매출', dashboard.today_revenue),
+            ('오늘 신규 환자', dashboard.today_new_patients),
+            ('이번 달 예약', dashboard.month_reservations),
+            ('이번 달 매출', dashboard.month_revenue),
+            ('전월 대비 성장률(%)', dashboard.month_growth_rate),
+            ('평균 평점', dashboard.average_rating),
+            ('리뷰 수', dashboard.total_reviews),
+            ('확정률(%)', dashboard.confirmation_rate),
+        ]:
+            sheet.append([label, value])
+    
+    workbook.save(path)
+    return row_count
+
+def export_filename(hospital_id: int, start_date: date, end_date: date, extension: str) -> str:
+    return f"hospital_{hospital_id}_stats_{start_date}_{end_date}.{extension}"
+
+# app/services/export_jobs.py
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Optional
-from app.database import get_db
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from app.core.config import settings
+from app.database import ReplicaSessionLocal
+from app.schemas.statistics import DashboardSummary, ExportJob, ExportJobStatus, PeriodStatistics
+from app.services.statistics_export import (
+    XLSX_MEDIA_TYPE,
+    build_export_query,
+    export_filename,
+    iter_csv_chunks,
+    iter_export_rows,
+    write_xlsx_export
+)
+import os
+import re
+import threading
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "excel": XLSX_MEDIA_TYPE}
+EXPORT_EXTENSIONS = {"csv": "csv", "excel": "xlsx"}
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+PROGRESS_INTERVAL = 1000  # 진행률 기록 주기 (행)
+
+class ExportQueueFullError(Exception):
+    """대기 중인 내보내기 작업이 한도를 넘음"""
+
+class ExportJobManager:
+    """대용량 내보내기 작업 관리
+    
+    작업은 요청 처리 스레드풀과 분리된 전용 워커 풀에서 실행되며, 작업 상태는
+    결과 파일과 같은 디렉터리에 JSON으로 기록되어 같은 호스트의 모든 워커에서 조회된다.
+    """
+    
+    def __init__(self, export_dir: str, max_workers: int = 2, max_pending: int = 20, ttl_hours: int = 24):
+        self.export_dir = export_dir
+        self.max_pending = max_pending
+        self.ttl = timedelta(hours=ttl_hours)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export-job")
+        self._pending = 0
+        self._lock = threading.Lock()
+        os.makedirs(export_dir, exist_ok=True)
+    
+    def _meta_path(self, job_id: str) -> str:
+        return os.path.join(self.export_dir, f"{job_id}.json")
+    
+    def file_path(self, job: ExportJob) -> str:
+        return os.path.join(self.export_dir, f"{job.job_id}.{EXPORT_EXTENSIONS[job.format]}")
+    
+    def _save(self, job: ExportJob):
+        """작업 상태 기록 (임시 파일 교체로 원자적 갱신)"""
+        tmp_path = self._meta_path(job.job_id) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(job.model_dump_json())
+        os.replace(tmp_path, self._meta_path(job.job_id))
+    
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        if not JOB_ID_PATTERN.match(job_id):
+            return None
+        try:
+            with open(self._meta_path(job_id), encoding="utf-8") as f:
+                return ExportJob.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+    
+    def submit(
+        self,
+        hospital_id: int,
+        user_id: int,
+        format: str,
+        start_date: date,
+        end_date: date,
+        period_statistics: Optional[PeriodStatistics] = None,
+        dashboard: Optional[DashboardSummary] = None
+    ) -> ExportJob:
+        """내보내기 작업 등록"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise ExportQueueFullError()
+            self._pending += 1
+        
+        self.cleanup_expired()
+        
+        job = ExportJob(
+            job_id=uuid.uuid4().hex,
+            hospital_id=hospital_id,
+            user_id=user_id,
+            format=format,
+            start_date=start_date,
+            end_date=end_date,
+            status=ExportJobStatus.QUEUED,
+            filename=export_filename(hospital_id, start_date, end_date, EXPORT_EXTENSIONS[format]),
+            created_at=datetime.utcnow()
+        )
+        self._save(job)
+        self._executor.submit(self._run, job, period_statistics, dashboard)
+        return job
+    
+    def _count_rows(self, job: ExportJob) -> int:
+        db = ReplicaSessionLocal()
+        try:
+            return build_export_query(db, job.hospital_id, job.start_date, job.end_date).order_by(None).count()
+        finally:
+            db.close()
+    
+    def _track_progress(self, job: ExportJob, rows):
+        """행을 넘기면서 PROGRESS_INTERVAL 마다 진행률 기록"""
+        for row in rows:
+            yield row
+            job.rows_done += 1
+            if job.rows_done % PROGRESS_INTERVAL == 0:
+                self._save(job)
+    
+    def _run(
+        self,
+        job: ExportJob,
+        period_statistics: Optional[PeriodStatistics],
+        dashboard: Optional[DashboardSummary]
+    ):
+        path = self.file_path(job)
+        part_path = path + ".part"
+        try:
+            job.status = ExportJobStatus.RUNNING
+            job.rows_total = self._count_rows(job)
+            self._save(job)
+            
+            rows = self._track_progress(job, iter_export_rows(job.hospital_id, job.start_date, job.end_date))
+            if job.format == "csv":
+                with open(part_path, "w", encoding="utf-8", newline="") as f:
+                    for chunk in iter_csv_chunks(rows):
+                        f.write(chunk)
+            else:
+                write_xlsx_export(part_path, rows, period_statistics, dashboard)
+            
+            # 완성된 파일만 다운로드 경로에 노출
+            os.replace(part_path, path)
+            job.status = ExportJobStatus.COMPLETED
+        except Exception as e:
+            logger.exception(f"내보내기 작업 실패: job_id={job.job_id}")
+            job.status = ExportJobStatus.FAILED
+            job.error = str(e)
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        finally:
+            job.finished_at = datetime.utcnow()
+            self._save(job)
+            with self._lock:
+                self._pending -= 1
+    
+    def cleanup_expired(self):
+        """보관 기간이 지난 작업 파일 삭제"""
+        expire_before = (datetime.utcnow() - self.ttl).timestamp()
+        for name in os.listdir(self.export_dir):
+            path = os.path.join(self.export_dir, name)
+            try:
+                if os.path.getmtime(path) < expire_before:
+                    os.remove(path)
+            except OSError:
+                pass
+
+def range_file_response(path: str, range_header: Optional[str], media_type: str, filename: str) -> Response:
+    """HTTP Range (단일 bytes 구간) 를 지원하는 파일 응답 - 중단된 다운로드 이어받기용"""
+    file_size = os.path.getsize(path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"'
+    }
+    
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip()) if range_header else None
+    if not match or not (match.group(1) or match.group(2)):
+        # Range 없음 또는 지원하지 않는 형식 (다중 구간 등) 은 전체 파일 전송
+        return FileResponse(path, media_type=media_type, headers=headers)
+    
+    if match.group(1):
+        start = int(match.group(1))
+        end = min(int(match.group(2)), file_size - 1) if match.group(2) else file_size - 1
+    else:
+        # bytes=-N : 마지막 N 바이트
+        start = max(file_size - int(match.group(2)), 0)
+        end = file_size - 1
+    
+    if start >= file_size or start > end:
+        return Response(
+            status_code=416,
+            headers={"Content-Range": f"bytes */{file_size}", "Accept-Ranges": "bytes"}
+        )
+    
+    def iter_range(chunk_size: int = 64 * 1024):
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+    
+    headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(iter_range(), status_code=206, media_type=media_type, headers=headers)
+
+export_job_manager = ExportJobManager(
+    settings.EXPORT_DIR,
+    max_workers=settings.EXPORT_WORKERS,
+    max_pending=settings.EXPORT_MAX_PENDING_JOBS,
+    ttl_hours=settings.EXPORT_JOB_TTL_HOURS
+)
+
+# app/api/v1/endpoints/statistics.py
+from fastapi import APIRouter, Depends, Query, HTTPException, Header, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, and_, or_, case
+from datetime import datetime, date, timedelta
+from typing import List, Optional, Tuple
+from bisect import bisect_right
+import os
+import tempfile
+from app.api.v1.dependencies import get_read_db_for_user
 from app.models.reservation import Reservation, ReservationStatus
-from app.models.payment import Payment, PaymentStatus
-from app.models.review import Review
+from app.models.payment import Payment
 from app.models.user import User
 from app.models.hospital import Hospital
 from app.models.medical_service import MedicalService
+from app.models.statistics import HospitalDailyStats
+from app.core.cache import statistics_cache
+from app.utils.date_range import date_range, on_date
+from app.services.statistics_export import (
+    XLSX_MEDIA_TYPE,
+    export_filename,
+    iter_csv_chunks,
+    iter_export_rows,
+    write_xlsx_export
+)
+from app.services.export_jobs import (
+    EXPORT_MEDIA_TYPES,
+    ExportQueueFullError,
+    export_job_manager,
+    range_file_response
+)
 from app.schemas.statistics import (
     DashboardSummary, 
+    ExportJob,
+    ExportJobResponse,
+    ExportJobStatus,
     PeriodStatistics, 
     PeriodType,
     TimeSlotStats,
@@ -96,12 +992,14 @@ from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
-def check_hospital_admin(current_user: User, hospital_id: int, db: Session):
+async def check_hospital_admin(current_user: User, hospital_id: int, db: AsyncSession):
     """병원 관리자 권한 확인"""
-    hospital = db.query(Hospital).filter(
-        Hospital.id == hospital_id,
-        Hospital.admin_id == current_user.id
-    ).first()
+    hospital = (await db.execute(
+        select(Hospital).where(
+            Hospital.id == hospital_id,
+            Hospital.admin_id == current_user.id
+        )
+    )).scalars().first()
     
     if not hospital and not current_user.is_superuser:
         raise HTTPException(
@@ -115,96 +1013,86 @@ def check_hospital_admin(current_user: User, hospital_id: int, db: Session):
 async def get_dashboard_summary(
     hospital_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db_for_user)
 ):
     """대시보드 요약 통계"""
     # 권한 확인
-    check_hospital_admin(current_user, hospital_id, db)
-    
-    today = date.today()
-    month_start = date(today.year, today.month, 1)
-    last_month_start = (month_start - timedelta(days=1)).replace(day=1)
-    last_month_end = month_start - timedelta(days=1)
+    hospital = await check_hospital_admin(current_user, hospital_id, db)
     
-    # 오늘 예약 수
-    today_reservations = db.query(func.count(Reservation.id)).filter(
-        Reservation.hospital_id == hospital_id,
-        func.date(Reservation.reservation_date) == today,
-        Reservation.status != ReservationStatus.CANCELLED
-    ).scalar() or 0
+    # 집계 쿼리는 동기 헬퍼를 run_sync 로 실행 (이벤트 루프를 막지 않음)
+    return await statistics_cache.get_or_build_async(
+        DashboardSummary,
+        "dashboard",
+        hospital_id,
+        {"today": date.today()},
+        lambda: db.run_sync(build_dashboard_snapshot, hospital_id, hospital)
+    )
+
+def reservation_kpi_query(db: Session, hospital_id: int, today: date):
+    """대시보드 예약 지표 조건부 집계 쿼리
     
-    # 오늘 매출
-    today_revenue = db.query(func.sum(Payment.amount)).join(
-        Reservation, Payment.reservation_id == Reservation.id
+    예약일/생성일 조건은 각각 (hospital_id, reservation_date), (hospital_id, created_at) 인덱스로 찾는다.
+    """
+    month_start = date(today.year, today.month, 1)
+    not_cancelled = Reservation.status != ReservationStatus.CANCELLED
+    created_this_month = Reservation.created_at >= month_start
+    return db.query(
+        func.count(case((and_(on_date(Reservation.reservation_date, today), not_cancelled), Reservation.id))).label('today_reservations'),
+        func.count(case((and_(Reservation.reservation_date >= month_start, not_cancelled), Reservation.id))).label('month_reservations'),
+        func.count(func.distinct(case((on_date(Reservation.created_at, today), Reservation.user_id)))).label('today_new_patients'),
+        func.count(case((created_this_month, Reservation.id))).label('month_created'),
+        func.count(case((
+            and_(created_this_month, Reservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.COMPLETED])),
+            Reservation.id
+        ))).label('month_confirmed')
     ).filter(
         Reservation.hospital_id == hospital_id,
-        func.date(Payment.created_at) == today,
-        Payment.status == PaymentStatus.COMPLETED
-    ).scalar() or 0
-    
-    # 오늘 신규 환자
-    today_new_patients = db.query(func.count(func.distinct(Reservation.user_id))).filter(
-        Reservation.hospital_id == hospital_id,
-        func.date(Reservation.created_at) == today
-    ).scalar() or 0
-    
-    # 이번 달 예약 수
-    month_reservations = db.query(func.count(Reservation.id)).filter(
-        Reservation.hospital_id == hospital_id,
-        Reservation.reservation_date >= month_start,
-        Reservation.status != ReservationStatus.CANCELLED
-    ).scalar() or 0
+        or_(Reservation.reservation_date >= month_start, created_this_month)
+    )
+
+def build_dashboard_snapshot(
+    db: Session,
+    hospital_id: int,
+    hospital: Optional[Hospital] = None,
+    today: Optional[date] = None
+) -> DashboardSummary:
+    """대시보드 요약 스냅샷 - 매출/예약 지표 쿼리 각 1회 + 인기 시간대/서비스 GROUP BY 2회"""
+    today = today or date.today()
+    month_start = date(today.year, today.month, 1)
+    last_month_start = (month_start - timedelta(days=1)).replace(day=1)
+    last_month_end = month_start - timedelta(days=1)
     
-    # 이번 달 매출
-    month_revenue = db.query(func.sum(Payment.amount)).join(
-        Reservation, Payment.reservation_id == Reservation.id
-    ).filter(
-        Reservation.hospital_id == hospital_id,
-        Payment.created_at >= month_start,
-        Payment.status == PaymentStatus.COMPLETED
-    ).scalar() or 0
+    def window_sum(column, start: date, end: Optional[date] = None):
+        in_window = date_range(HospitalDailyStats.stat_date, start, end)
+        return func.coalesce(func.sum(case((in_window, column), else_=0)), 0)
     
-    # 지난 달 매출 (성장률 계산용)
-    last_month_revenue = db.query(func.sum(Payment.amount)).join(
-        Reservation, Payment.reservation_id == Reservation.id
+    # 오늘 / 이번 달 / 지난 달 매출 (일간 집계 테이블 조건부 집계 1회)
+    revenue = db.query(
+        window_sum(HospitalDailyStats.completed_amount, today, today).label('today_revenue'),
+        window_sum(HospitalDailyStats.completed_amount, month_start).label('month_revenue'),
+        window_sum(HospitalDailyStats.completed_amount, last_month_start, last_month_end).label('last_month_revenue')
     ).filter(
-        Reservation.hospital_id == hospital_id,
-        Payment.created_at >= last_month_start,
-        Payment.created_at <= last_month_end,
-        Payment.status == PaymentStatus.COMPLETED
-    ).scalar() or 0
+        HospitalDailyStats.hospital_id == hospital_id,
+        HospitalDailyStats.stat_date >= last_month_start
+    ).one()
     
     # 성장률 계산
     month_growth_rate = 0
-    if last_month_revenue > 0:
-        month_growth_rate = ((month_revenue - last_month_revenue) / last_month_revenue) * 100
+    if revenue.last_month_revenue > 0:
+        month_growth_rate = ((revenue.month_revenue - revenue.last_month_revenue) / revenue.last_month_revenue) * 100
     
-    # 평균 평점
-    rating_stats = db.query(
-        func.avg(Review.rating),
-        func.count(Review.id)
-    ).filter(
-        Review.hospital_id == hospital_id
-    ).first()
+    # 평균 평점 (병원 테이블에 리뷰 작성 시 갱신되어 있음)
+    if hospital is None:
+        hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
+    average_rating = round(hospital.average_rating or 0, 1) if hospital else 0
+    total_reviews = (hospital.review_count or 0) if hospital else 0
     
-    average_rating = round(rating_stats[0], 1) if rating_stats[0] else 0
-    total_reviews = rating_stats[1] or 0
-    
-    # 확정률 (이번 달)
-    total_reservations_month = db.query(func.count(Reservation.id)).filter(
-        Reservation.hospital_id == hospital_id,
-        Reservation.created_at >= month_start
-    ).scalar() or 0
-    
-    confirmed_reservations = db.query(func.count(Reservation.id)).filter(
-        Reservation.hospital_id == hospital_id,
-        Reservation.created_at >= month_start,
-        Reservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.COMPLETED])
-    ).scalar() or 0
+    # 예약 수 (예약일 기준) / 신규 환자 / 확정률 (생성일 기준) - reservations 조건부 집계 1회
+    reservations = reservation_kpi_query(db, hospital_id, today).one()
     
     confirmation_rate = 0
-    if total_reservations_month > 0:
-        confirmation_rate = (confirmed_reservations / total_reservations_month) * 100
+    if reservations.month_created > 0:
+        confirmation_rate = (reservations.month_confirmed / reservations.month_created) * 100
     
     # 인기 시간대 (최근 30일)
     thirty_days_ago = today - timedelta(days=30)
@@ -256,11 +1144,11 @@ async def get_dashboard_summary(
         ))
     
     return DashboardSummary(
-        today_reservations=today_reservations,
-        today_revenue=today_revenue,
-        today_new_patients=today_new_patients,
-        month_reservations=month_reservations,
-        month_revenue=month_revenue,
+        today_reservations=reservations.today_reservations,
+        today_revenue=revenue.today_revenue,
+        today_new_patients=reservations.today_new_patients,
+        month_reservations=reservations.month_reservations,
+        month_revenue=revenue.month_revenue,
         month_growth_rate=round(month_growth_rate, 1),
         average_rating=average_rating,
         total_reviews=total_reviews,
@@ -276,11 +1164,11 @@ async def get_period_statistics(
     end_date: date = Query(..., description="종료 날짜"),
     period_type: PeriodType = Query(PeriodType.DAILY, description="집계 단위"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db_for_user)
 ):
     """기간별 상세 통계"""
     # 권한 확인
-    check_hospital_admin(current_user, hospital_id, db)
+    await check_hospital_admin(current_user, hospital_id, db)
     
     # 날짜 유효성 검사
     if start_date > end_date:
@@ -289,44 +1177,68 @@ async def get_period_statistics(
             detail="시작 날짜는 종료 날짜보다 이전이어야 합니다."
         )
     
-    # 기간별 예약 통계
-    reservation_stats = []
-    revenue_stats = []
+    return await statistics_cache.get_or_build_async(
+        PeriodStatistics,
+        "period",
+        hospital_id,
+        {"start": start_date, "end": end_date, "type": period_type.value},
+        lambda: db.run_sync(compute_period_statistics, hospital_id, start_date, end_date, period_type)
+    )
+
+def compute_period_statistics(
+    db: Session,
+    hospital_id: int,
+    start_date: date,
+    end_date: date,
+    period_type: PeriodType
+) -> PeriodStatistics:
+    """기간별 통계 계산 (구간 수와 무관하게 예약/매출 조회 각 1회)"""
+    buckets = build_period_buckets(start_date, end_date, period_type)
+    
+    # 기간별 예약/매출 통계
+    reservation_stats, revenue_stats = get_bucketed_statistics(db, hospital_id, buckets)
+    
+    # 전체 통계
+    total_reservations = sum(stat.total_count for stat in reservation_stats)
+    total_revenue = sum(stat.total_revenue for stat in revenue_stats)
+    
+    days_count = (end_date - start_date).days + 1
+    avg_daily_reservations = total_reservations / days_count if days_count > 0 else 0
+    avg_daily_revenue = total_revenue / days_count if days_count > 0 else 0
+    
+    return PeriodStatistics(
+        start_date=start_date,
+        end_date=end_date,
+        reservations=reservation_stats,
+        revenues=revenue_stats,
+        total_reservations=total_reservations,
+        total_revenue=total_revenue,
+        average_daily_reservations=round(avg_daily_reservations, 1),
+        average_daily_revenue=round(avg_daily_revenue, 2)
+    )
+
+def build_period_buckets(start_date: date, end_date: date, period_type: PeriodType) -> List[Tuple[str, date, date]]:
+    """집계 구간 목록 생성 (라벨, 시작일, 종료일)"""
+    buckets = []
     
     if period_type == PeriodType.DAILY:
-        # 일별 통계
+        # 일별 구간
         current_date = start_date
         while current_date <= end_date:
-            # 예약 통계
-            stats = get_daily_reservation_stats(db, hospital_id, current_date)
-            reservation_stats.append(stats)
-            
-            # 매출 통계
-            revenue = get_daily_revenue_stats(db, hospital_id, current_date)
-            revenue_stats.append(revenue)
-            
+            buckets.append((current_date.strftime('%Y-%m-%d'), current_date, current_date))
             current_date += timedelta(days=1)
             
     elif period_type == PeriodType.WEEKLY:
-        # 주별 통계
+        # 주별 구간 (시작 날짜 기준 7일 단위)
         current_date = start_date
         while current_date <= end_date:
             week_end = min(current_date + timedelta(days=6), end_date)
-            
-            # 예약 통계
-            stats = get_period_reservation_stats(db, hospital_id, current_date, week_end)
-            stats.period = f"{current_date.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')}"
-            reservation_stats.append(stats)
-            
-            # 매출 통계
-            revenue = get_period_revenue_stats(db, hospital_id, current_date, week_end)
-            revenue.period = f"{current_date.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')}"
-            revenue_stats.append(revenue)
-            
+            label = f"{current_date.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')}"
+            buckets.append((label, current_date, week_end))
             current_date += timedelta(days=7)
             
     elif period_type == PeriodType.MONTHLY:
-        # 월별 통계
+        # 월별 구간 (첫 구간은 해당 월 1일부터)
         current_date = start_date.replace(day=1)
         while current_date <= end_date:
             if current_date.month == 12:
@@ -334,79 +1246,102 @@ async def get_period_statistics(
             else:
                 next_month = current_date.replace(month=current_date.month + 1)
             month_end = min(next_month - timedelta(days=1), end_date)
-            
-            # 예약 통계
-            stats = get_period_reservation_stats(db, hospital_id, current_date, month_end)
-            stats.period = current_date.strftime('%Y-%m')
-            reservation_stats.append(stats)
-            
-            # 매출 통계
-            revenue = get_period_revenue_stats(db, hospital_id, current_date, month_end)
-            revenue.period = current_date.strftime('%Y-%m')
-            revenue_stats.append(revenue)
-            
+            buckets.append((current_date.strftime('%Y-%m'), current_date, month_end))
             current_date = next_month
+            
+    elif period_type == PeriodType.YEARLY:
+        # 연별 구간 (첫 구간은 해당 연도 1월 1일부터)
+        current_date = start_date.replace(month=1, day=1)
+        while current_date <= end_date:
+            year_end = min(date(current_date.year, 12, 31), end_date)
+            buckets.append((current_date.strftime('%Y'), current_date, year_end))
+            current_date = date(current_date.year + 1, 1, 1)
     
-    # 전체 통계
-    total_reservations = sum(stat.total_count for stat in reservation_stats)
-    total_revenue = sum(stat.total_revenue for stat in revenue_stats)
+    return buckets
+
+def _to_date(value) -> date:
+    """DB 드라이버별 날짜 반환값 정규화 (SQLite는 문자열 반환)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+def _accumulate_buckets(buckets: List[Tuple[str, date, date]], rows, width: int) -> List[list]:
+    """일자별 행 (날짜, 값...)을 구간별로 합산 - 데이터가 없는 구간은 0"""
+    totals = [[0] * width for _ in buckets]
+    bucket_starts = [bucket_start for _, bucket_start, _ in buckets]
     
-    days_count = (end_date - start_date).days + 1
-    avg_daily_reservations = total_reservations / days_count if days_count > 0 else 0
-    avg_daily_revenue = total_revenue / days_count if days_count > 0 else 0
+    for row in rows:
+        index = bisect_right(bucket_starts, _to_date(row[0])) - 1
+        if index < 0:
+            continue
+        for i, value in enumerate(row[1:]):
+            totals[index][i] += value or 0
     
-    return PeriodStatistics(
-        start_date=start_date,
-        end_date=end_date,
-        reservations=reservation_stats,
-        revenues=revenue_stats,
-        total_reservations=total_reservations,
-        total_revenue=total_revenue,
-        average_daily_reservations=round(avg_daily_reservations, 1),
-        average_daily_revenue=round(avg_daily_revenue, 2)
-    )
+    return totals
 
-def get_daily_reservation_stats(db: Session, hospital_id: int, date: date) -> ReservationStats:
-    """일별 예약 통계"""
-    base_query = db.query(Reservation).filter(
+def reservation_bucket_query(db: Session, hospital_id: int, range_start: date, range_end: date):
+    """예약일 기준 일자별 상태 건수 GROUP BY 쿼리 ((hospital_id, reservation_date) INCLUDE status 인덱스만으로 계산)"""
+    day = func.date(Reservation.reservation_date)
+    return db.query(
+        day,
+        func.count(Reservation.id),
+        func.sum(case((Reservation.status == ReservationStatus.CONFIRMED, 1), else_=0)),
+        func.sum(case((Reservation.status == ReservationStatus.CANCELLED, 1), else_=0)),
+        func.sum(case((Reservation.status == ReservationStatus.COMPLETED, 1), else_=0)),
+        func.sum(case((Reservation.status == ReservationStatus.NO_SHOW, 1), else_=0))
+    ).filter(
         Reservation.hospital_id == hospital_id,
-        func.date(Reservation.reservation_date) == date
-    )
+        date_range(Reservation.reservation_date, range_start, range_end)
+    ).group_by(day)
+
+def get_bucketed_statistics(
+    db: Session,
+    hospital_id: int,
+    buckets: List[Tuple[str, date, date]]
+) -> Tuple[List[ReservationStats], List[RevenueStats]]:
+    """구간별 예약/매출 통계 - 예약은 reservations 일자별 GROUP BY, 매출은 일간 집계 테이블을 한 번씩 읽어 구간별로 합산"""
+    if not buckets:
+        return [], []
     
-    total = base_query.count()
-    confirmed = base_query.filter(Reservation.status == ReservationStatus.CONFIRMED).count()
-    cancelled = base_query.filter(Reservation.status == ReservationStatus.CANCELLED).count()
-    completed = base_query.filter(Reservation.status == ReservationStatus.COMPLETED).count()
-    no_show = base_query.filter(Reservation.status == ReservationStatus.NO_SHOW).count()
+    range_start, range_end = buckets[0][1], buckets[-1][2]
     
-    return ReservationStats(
-        period=date.strftime('%Y-%m-%d'),
-        total_count=total,
-        confirmed_count=confirmed,
-        cancelled_count=cancelled,
-        completed_count=completed,
-        no_show_count=no_show,
-        confirmation_rate=round((confirmed / total * 100) if total > 0 else 0, 1),
-        cancellation_rate=round((cancelled / total * 100) if total > 0 else 0, 1),
-        completion_rate=round((completed / total * 100) if total > 0 else 0, 1)
-    )
-
-def get_period_reservation_stats(db: Session, hospital_id: int, start: date, end: date) -> ReservationStats:
-    """기간별 예약 통계"""
-    base_query = db.query(Reservation).filter(
-        Reservation.hospital_id == hospital_id,
-        Reservation.reservation_date >= start,
-        Reservation.reservation_date <= end
-    )
+    # 예약 (예약일 기준)
+    reservation_rows = reservation_bucket_query(db, hospital_id, range_start, range_end).all()
     
-    total = base_query.count()
-    confirmed = base_query.filter(Reservation.status == ReservationStatus.CONFIRMED).count()
-    cancelled = base_query.filter(Reservation.status == ReservationStatus.CANCELLED).count()
-    completed = base_query.filter(Reservation.status == ReservationStatus.COMPLETED).count()
-    no_show = base_query.filter(Reservation.status == ReservationStatus.NO_SHOW).count()
+    # 매출 (결제 생성일 기준)
+    revenue_rows = db.query(
+        HospitalDailyStats.stat_date,
+        HospitalDailyStats.payment_count,
+        HospitalDailyStats.completed_amount,
+        HospitalDailyStats.refunded_amount
+    ).filter(
+        HospitalDailyStats.hospital_id == hospital_id,
+        date_range(HospitalDailyStats.stat_date, range_start, range_end)
+    ).all()
     
+    reservation_stats = [
+        build_reservation_stats(label, *counts)
+        for (label, _, _), counts in zip(buckets, _accumulate_buckets(buckets, reservation_rows, 5))
+    ]
+    revenue_stats = [
+        build_revenue_stats(label, *amounts)
+        for (label, _, _), amounts in zip(buckets, _accumulate_buckets(buckets, revenue_rows, 3))
+    ]
+    return reservation_stats, revenue_stats
+
+def build_reservation_stats(
+    period: str,
+    total: int,
+    confirmed: int,
+    cancelled: int,
+    completed: int,
+    no_show: int
+) -> ReservationStats:
+    """상태별 예약 건수로 ReservationStats 생성"""
     return ReservationStats(
-        period="",  # 호출하는 곳에서 설정
+        period=period,
         total_count=total,
         confirmed_count=confirmed,
         cancelled_count=cancelled,
@@ -417,25 +1352,15 @@ def get_period_reservation_stats(db: Session, hospital_id: int, start: date, end
         completion_rate=round((completed / total * 100) if total > 0 else 0, 1)
     )
 
-def get_daily_revenue_stats(db: Session, hospital_id: int, date: date) -> RevenueStats:
-    """일별 매출 통계"""
-    payments = db.query(
-        func.count(Payment.id),
-        func.sum(case((Payment.status == PaymentStatus.COMPLETED, Payment.amount), else_=0)),
-        func.sum(case((Payment.status == PaymentStatus.REFUNDED, Payment.amount), else_=0))
-    ).join(
-        Reservation, Payment.reservation_id == Reservation.id
-    ).filter(
-        Reservation.hospital_id == hospital_id,
-        func.date(Payment.created_at) == date
-    ).first()
-    
-    payment_count = payments[0] or 0
-    completed_amount = payments[1] or 0
-    refunded_amount = payments[2] or 0
-    
+def build_revenue_stats(
+    period: str,
+    payment_count: int,
+    completed_amount: float,
+    refunded_amount: float
+) -> RevenueStats:
+    """결제 건수/금액으로 RevenueStats 생성"""
     return RevenueStats(
-        period=date.strftime('%Y-%m-%d'),
+        period=period,
         total_revenue=completed_amount,
         completed_payments=completed_amount,
         refunded_amount=refunded_amount,
@@ -444,33 +1369,18 @@ def get_daily_revenue_stats(db: Session, hospital_id: int, date: date) -> Revenu
         payment_count=payment_count
     )
 
-def get_period_revenue_stats(db: Session, hospital_id: int, start: date, end: date) -> RevenueStats:
-    """기간별 매출 통계"""
-    payments = db.query(
-        func.count(Payment.id),
-        func.sum(case((Payment.status == PaymentStatus.COMPLETED, Payment.amount), else_=0)),
-        func.sum(case((Payment.status == PaymentStatus.REFUNDED, Payment.amount), else_=0))
-    ).join(
-        Reservation, Payment.reservation_id == Reservation.id
-    ).filter(
-        Reservation.hospital_id == hospital_id,
-        Payment.created_at >= start,
-        Payment.created_at <= end
-    ).first()
-    
-    payment_count = payments[0] or 0
-    completed_amount = payments[1] or 0
-    refunded_amount = payments[2] or 0
+@router.get("/cache/stats")
+async def get_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """통계 캐시 적중률 조회 (관리자 전용)"""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="권한이 없습니다."
+        )
     
-    return RevenueStats(
-        period="",  # 호출하는 곳에서 설정
-        total_revenue=completed_amount,
-        completed_payments=completed_amount,
-        refunded_amount=refunded_amount,
-        net_revenue=completed_amount - refunded_amount,
-        average_payment=round(completed_amount / payment_count if payment_count > 0 else 0, 2),
-        payment_count=payment_count
-    )
+    return statistics_cache.stats()
 
 @router.get("/export/{hospital_id}")
 async def export_statistics(
@@ -478,72 +1388,650 @@ async def export_statistics(
     start_date: date = Query(...),
     end_date: date = Query(...),
     format: str = Query("csv", regex="^(csv|excel)$"),
+    period_type: PeriodType = Query(PeriodType.DAILY, description="엑셀 기간별 시트 집계 단위"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db_for_user)
 ):
     """통계 데이터 내보내기"""
     # 권한 확인
-    check_hospital_admin(current_user, hospital_id, db)
+    hospital = await check_hospital_admin(current_user, hospital_id, db)
     
-    # 데이터 조회
-    reservations = db.query(
-        Reservation.id,
-        Reservation.reservation_date,
-        Reservation.time_slot,
-        User.name.label('patient_name'),
-        MedicalService.name.label('service_name'),
-        Reservation.status,
-        Payment.amount,
-        Payment.status.label('payment_status')
-    ).join(
-        User, Reservation.user_id == User.id
-    ).join(
-        MedicalService, Reservation.service_id == MedicalService.id
-    ).outerjoin(
-        Payment, Payment.reservation_id == Reservation.id
-    ).filter(
-        Reservation.hospital_id == hospital_id,
-        Reservation.reservation_date >= start_date,
-        Reservation.reservation_date <= end_date
-    ).all()
+    # 날짜 유효성 검사
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작 날짜는 종료 날짜보다 이전이어야 합니다."
+        )
     
     if format == "csv":
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # 헤더
-        writer.writerow(['예약ID', '예약일시', '시간대', '환자명', '서비스', '예약상태', '결제금액', '결제상태'])
-        
-        # 데이터
-        for row in reservations:
-            writer.writerow([
-                row.id,
-                row.reservation_date.strftime('%Y-%m-%d'),
-                row.time_slot,
-                row.patient_name,
-                row.service_name,
-                row.status.value if row.status else '',
-                row.amount or 0,
-                row.payment_status.value if row.payment_status else '미결제'
-            ])
+        filename = export_filename(hospital_id, start_date, end_date, "csv")
+        return StreamingResponse(
+            iter_csv_chunks(iter_export_rows(hospital_id, start_date, end_date)),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    
+    # Excel: 임시 파일에 작성 후 전송, 전송 완료 시 삭제
+    period_statistics = await db.run_sync(compute_period_statistics, hospital_id, start_date, end_date, period_type)
+    dashboard = await db.run_sync(build_dashboard_snapshot, hospital_id, hospital)
+    
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        await run_in_threadpool(
+            write_xlsx_export,
+            path,
+            iter_export_rows(hospital_id, start_date, end_date),
+            period_statistics,
+            dashboard
+        )
+    except Exception:
+        os.remove(path)
+        raise
+    
+    return FileResponse(
+        path,
+        media_type=XLSX_MEDIA_TYPE,
+        filename=export_filename(hospital_id, start_date, end_date, "xlsx"),
+        background=BackgroundTask(os.remove, path)
+    )
+
+@router.post("/export/{hospital_id}/jobs", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    hospital_id: int,
+    request: Request,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    format: str = Query("csv", regex="^(csv|excel)$"),
+    period_type: PeriodType = Query(PeriodType.DAILY, description="엑셀 기간별 시트 집계 단위"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db_for_user)
+):
+    """대용량 내보내기 작업 등록 (백그라운드 처리 후 다운로드)"""
+    # 권한 확인
+    hospital = await check_hospital_admin(current_user, hospital_id, db)
+    
+    # 날짜 유효성 검사
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작 날짜는 종료 날짜보다 이전이어야 합니다."
+        )
+    
+    # 엑셀 요약 시트는 집계 테이블 기반이라 요청 시점에 계산
+    period_statistics = None
+    dashboard = None
+    if format == "excel":
+        period_statistics = await db.run_sync(compute_period_statistics, hospital_id, start_date, end_date, period_type)
+        dashboard = await db.run_sync(build_dashboard_snapshot, hospital_id, hospital)
+    
+    try:
+        job = export_job_manager.submit(
+            hospital_id, current_user.id, format, start_date, end_date, period_statistics, dashboard
+        )
+    except ExportQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="처리 중인 내보내기 작업이 많습니다. 잠시 후 다시 시도해주세요."
+        )
+    
+    return build_export_job_response(request, job)
+
+@router.get("/export/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """내보내기 작업 진행률 조회"""
+    job = get_own_export_job(job_id, current_user)
+    return build_export_job_response(request, job)
+
+@router.get("/export/jobs/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    current_user: User = Depends(get_current_user)
+):
+    """완료된 내보내기 파일 다운로드 (Range 요청으로 이어받기 지원)"""
+    job = get_own_export_job(job_id, current_user)
+    
+    if job.status != ExportJobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="내보내기 작업이 아직 완료되지 않았습니다."
+        )
+    
+    return range_file_response(
+        export_job_manager.file_path(job),
+        range_header,
+        EXPORT_MEDIA_TYPES[job.format],
+        job.filename
+    )
+
+def get_own_export_job(job_id: str, current_user: User) -> ExportJob:
+    """요청자의 내보내기 작업 조회"""
+    job = export_job_manager.get(job_id)
+    
+    if not job or (job.user_id != current_user.id and not current_user.is_superuser):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="내보내기 작업을 찾을 수 없습니다."
+        )
+    
+    return job
+
+def build_export_job_response(request: Request, job: ExportJob) -> ExportJobResponse:
+    progress = 0
+    if job.status == ExportJobStatus.COMPLETED:
+        progress = 100
+    elif job.rows_total:
+        progress = job.rows_done / job.rows_total * 100
+    
+    download_url = None
+    if job.status == ExportJobStatus.COMPLETED:
+        download_url = str(request.url_for("download_export_job", job_id=job.job_id))
+    
+    return ExportJobResponse(
+        job_id=job.job_id,
+        hospital_id=job.hospital_id,
+        format=job.format,
+        status=job.status,
+        rows_done=job.rows_done,
+        rows_total=job.rows_total,
+        progress=round(progress, 1),
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        download_url=download_url
+    )
+
+# scripts/backfill_hospital_daily_stats.py
+import argparse
+from datetime import date
+from app.database import SessionLocal
+from app.models.hospital import Hospital
+from app.services.statistics_rollup import rebuild_hospital_daily_stats
+
+def main():
+    """일간 통계 집계 테이블 백필
+    
+    사용법: python -m scripts.backfill_hospital_daily_stats [--hospital-id 1] [--start 2024-01-01] [--end 2024-12-31]
+    """
+    parser = argparse.ArgumentParser(description="hospital_daily_stats 재계산")
+    parser.add_argument("--hospital-id", type=int, default=None)
+    parser.add_argument("--start", type=date.fromisoformat, default=None)
+    parser.add_argument("--end", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        if args.hospital_id is not None:
+            hospital_ids = [args.hospital_id]
+        else:
+            hospital_ids = [hospital_id for (hospital_id,) in db.query(Hospital.id).order_by(Hospital.id)]
         
-        output.seek(0)
-        return {
-            "filename": f"hospital_{hospital_id}_stats_{start_date}_{end_date}.csv",
-            "content": output.getvalue(),
-            "content_type": "text/csv"
-        }
+        # 재계산 동안 집계 테이블 잠금이 유지되므로 병원마다 커밋해 결제 처리 대기를 짧게 유지
+        count = 0
+        for hospital_id in hospital_ids:
+            count += rebuild_hospital_daily_stats(db, hospital_id, args.start, args.end)
+            db.commit()
+        print(f"{count}개 일간 집계 행을 재계산했습니다.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
+
+# scripts/bench_dashboard.py
+import argparse
+import asyncio
+import time
+from collections import Counter
+from sqlalchemy import event, func, select
+from app.api.v1.endpoints.statistics import build_dashboard_snapshot
+from app.core.cache import InMemoryAsyncCache, InMemoryLRUCache, StatisticsCache
+from app.database import AsyncSessionLocal, async_engine
+from app.models.hospital import Hospital
+from app.models.reservation import Reservation
+from app.schemas.statistics import DashboardSummary
+
+class RoundTripCounter:
+    """엔진에서 실행된 SQL 문 수 (= DB 왕복 수) 집계"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = Counter()
+    
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+    
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+    
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements[" ".join(statement.split())[:80]] += 1
+    
+    @property
+    def total(self) -> int:
+        return sum(self.statements.values())
+
+def percentile(ordered: list, p: float) -> float:
+    index = min(int(len(ordered) * p), len(ordered) - 1)
+    return round(ordered[index] * 1000, 1)
+
+async def busiest_hospital_id() -> int:
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(
+            select(Reservation.hospital_id).group_by(Reservation.hospital_id)
+            .order_by(func.count().desc()).limit(1)
+        )).scalar_one()
+
+async def load_dashboard(hospital_id: int, cache: StatisticsCache = None) -> DashboardSummary:
+    """대시보드 엔드포인트와 같은 경로 (권한 확인용 병원 조회 + run_sync 집계, cache 가 있으면 캐시 경유)"""
+    async with AsyncSessionLocal() as db:
+        hospital = await db.get(Hospital, hospital_id)
+        build = lambda: db.run_sync(build_dashboard_snapshot, hospital_id, hospital)
+        if cache is None:
+            return await build()
+        return await cache.get_or_build_async(DashboardSummary, "dashboard", hospital_id, {}, build)
+
+async def measure(hospital_id: int, runs: int, concurrency: int, cache: StatisticsCache = None) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    durations = []
+    
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await load_dashboard(hospital_id, cache)
+            durations.append(time.perf_counter() - started)
+    
+    with RoundTripCounter(async_engine.sync_engine) as counter:
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(runs)))
+        elapsed = time.perf_counter() - started
+    
+    durations.sort()
+    return {
+        "round_trips": counter.total / runs,
+        "statements": counter.statements,
+        "p50": percentile(durations, 0.5),
+        "p95": percentile(durations, 0.95),
+        "p99": percentile(durations, 0.99),
+        "rps": runs / elapsed
+    }
+
+async def run(args):
+    hospital_id = args.hospital_id or await busiest_hospital_id()
+    await load_dashboard(hospital_id)  # 커넥션 풀 / 플랜 캐시 예열
+    
+    backend = InMemoryLRUCache()
+    scenarios = [("캐시 없음", None), ("캐시 적중", StatisticsCache(backend, 3600, InMemoryAsyncCache(backend)))]
+    
+    print(f"병원 {hospital_id} 대시보드 {args.runs}회, 동시 {args.concurrency}")
+    for name, scenario_cache in scenarios:
+        result = await measure(hospital_id, args.runs, args.concurrency, scenario_cache)
+        print(
+            f"{name:>6}: 요청당 DB 왕복 {result['round_trips']:.2f}회, "
+            f"p50 {result['p50']} ms, p95 {result['p95']} ms, p99 {result['p99']} ms, {result['rps']:.1f} req/s"
+        )
+        if scenario_cache is None:
+            for statement, count in result["statements"].most_common():
+                print(f"    {count / args.runs:.2f}x {statement}")
+    
+    await async_engine.dispose()
+
+def main():
+    """대시보드 요약 DB 왕복 수 / 응답 시간 측정 (실제 DB 대상, 읽기 전용)
+    
+    엔드포인트와 같은 경로로 스냅샷을 만들면서 요청당 실행된 SQL 문 수와 p50/p95/p99 를 출력한다.
+    
+    사용법: python -m scripts.bench_dashboard [--hospital-id 1] [--runs 200] [--concurrency 10]
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hospital-id", type=int, default=None, help="기본값: 예약이 가장 많은 병원")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
+
+# scripts/bench_statistics_export.py
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from datetime import date
+from app.services.statistics_export import iter_csv_chunks, iter_export_rows, write_xlsx_export
+
+def fake_export_rows(count: int):
+    """format_export_row 결과와 같은 모양의 행 생성기 (DB 불필요)"""
+    for i in range(count):
+        yield [i, "2024-03-01", "10:00", f"환자{i}", "스케일링", "confirmed", 50000, "completed"]
+
+def export_once(fmt: str, source: dict) -> dict:
+    """새 프로세스에서 내보내기 1회 실행 (최대 RSS 를 다른 크기와 섞지 않기 위해)"""
+    if source["hospital_id"] is None:
+        rows = fake_export_rows(source["rows"])
+    else:
+        rows = iter_export_rows(source["hospital_id"], source["start"], source["end"])
+    
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"export.{fmt}")
+        started = time.perf_counter()
+        if fmt == "xlsx":
+            row_count = write_xlsx_export(path, rows)
+        else:
+            row_count = 0
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                for chunk in iter_csv_chunks(rows):
+                    f.write(chunk)
+                    row_count += chunk.count("\n")
+            row_count -= 1  # 헤더
+        elapsed = time.perf_counter() - started
+        size = os.path.getsize(path)
+    
+    return {
+        "rows": row_count,
+        "elapsed": elapsed,
+        "file_mb": size / 1024 / 1024,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "rss_growth_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024
+    }
+
+def main():
+    """통계 내보내기 처리량(행/초)과 최대 RSS 측정
+    
+    행 수를 늘려도 최대 RSS 가 거의 일정하면 write-only / 스트리밍 경로가 제대로 동작하는 것이다.
+    기본은 가짜 행(DB 불필요), --hospital-id 를 주면 실제 DB(읽기 복제본)의 예약을 내보낸다.
     
-    # Excel 형식은 추가 구현 필요
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Excel 형식은 아직 지원되지 않습니다."
+    사용법: python -m scripts.bench_statistics_export [--rows 10000 100000 500000] [--format xlsx csv]
+           python -m scripts.bench_statistics_export --hospital-id 1 --start 2024-01-01 --end 2024-12-31
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--format", nargs="+", choices=["xlsx", "csv"], default=["xlsx", "csv"])
+    parser.add_argument("--hospital-id", type=int, default=None)
+    parser.add_argument("--start", type=date.fromisoformat, default=None)
+    parser.add_argument("--end", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+    
+    if args.hospital_id is None:
+        sources = [{"hospital_id": None, "rows": rows} for rows in args.rows]
+    else:
+        sources = [{"hospital_id": args.hospital_id, "start": args.start, "end": args.end}]
+    
+    # 측정마다 새 프로세스 (maxtasksperchild=1) 에서 실행
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for fmt in args.format:
+            for source in sources:
+                result = pool.apply(export_once, (fmt, source))
+                print(
+                    f"{fmt:>4} {result['rows']:>9,}행: {result['rows'] / result['elapsed']:>10,.0f} 행/초, "
+                    f"{result['elapsed']:.2f}초, 파일 {result['file_mb']:.1f} MB, "
+                    f"최대 RSS {result['peak_rss_mb']:.1f} MB (내보내기 중 증가 {result['rss_growth_mb']:.1f} MB)"
+                )
+
+if __name__ == "__main__":
+    main()
+
+# tests/test_statistics_export.py
+import csv
+import io
+import tracemalloc
+from app.services.statistics_export import EXPORT_HEADER, iter_csv_chunks
+
+def fake_export_rows(count: int):
+    """format_export_row 결과와 같은 모양의 행 생성기 (DB 불필요)"""
+    for i in range(count):
+        yield [i, "2024-03-01", "10:00", f"환자{i}", "스케일링", "confirmed", 50000, "completed"]
+
+def peak_memory_while_streaming(count: int, chunk_rows: int = 500) -> int:
+    """CSV 조각을 받는 즉시 버리면서 내보낼 때의 최대 메모리 사용량 (바이트)"""
+    tracemalloc.start()
+    try:
+        for _ in iter_csv_chunks(fake_export_rows(count), chunk_rows=chunk_rows):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_csv_chunks_contain_bom_header_and_all_rows():
+    chunks = list(iter_csv_chunks(fake_export_rows(1201), chunk_rows=500))
+    
+    # 500 행마다 한 조각 + 남은 행 조각
+    assert len(chunks) == 3
+    content = "".join(chunks)
+    assert content.startswith("\ufeff")
+    
+    rows = list(csv.reader(io.StringIO(content[1:])))
+    assert rows[0] == EXPORT_HEADER
+    assert len(rows) == 1202
+    assert rows[-1][0] == "1200"
+
+def test_csv_chunk_size_is_bounded_by_chunk_rows():
+    chunks = list(iter_csv_chunks(fake_export_rows(5000), chunk_rows=100))
+    
+    largest_chunk = max(len(chunk) for chunk in chunks[1:])
+    assert largest_chunk <= len(chunks[1]) * 1.1
+
+def test_csv_export_peak_memory_stays_flat():
+    # 행 수가 50배가 되어도 최대 메모리는 조각 하나 크기 수준에서 거의 변하지 않아야 한다
+    small = peak_memory_while_streaming(4_000)
+    large = peak_memory_while_streaming(200_000)
+    
+    assert large < small * 1.5 + 64 * 1024
+
+# tests/test_statistics_cache.py
+import asyncio
+import pytest
+from pydantic import BaseModel
+from app.core import cache as cache_module
+from app.core.cache import (
+    AsyncRedisCache,
+    InMemoryAsyncCache,
+    InMemoryLRUCache,
+    RedisCache,
+    StatisticsCache,
+    on_reservation_status_changed,
+    on_reservation_status_changed_async
+)
+
+TTL = 60
+
+class Snapshot(BaseModel):
+    hospital_id: int
+    build: int
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
+
+class FakeRedis:
+    """dict 기반 redis.Redis 대역 (get / set(ex=) / incr, 값은 bytes 로 돌려줌)"""
+    
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.data = {}  # key -> (bytes, expires_at 또는 None)
+    
+    def get(self, key: str):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self.data[key]
+            return None
+        return value
+    
+    def set(self, key: str, value, ex=None):
+        self.data[key] = (str(value).encode("utf-8"), self.clock() + ex if ex else None)
+    
+    def incr(self, key: str) -> int:
+        value = int(self.get(key) or 0) + 1
+        self.data[key] = (str(value).encode("utf-8"), None)
+        return value
+
+class FakeAsyncRedis:
+    """redis.asyncio.Redis 대역 (FakeRedis 와 저장소 공유)"""
+    
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+    
+    async def get(self, key: str):
+        return self.redis.get(key)
+    
+    async def set(self, key: str, value, ex=None):
+        self.redis.set(key, value, ex=ex)
+    
+    async def incr(self, key: str) -> int:
+        return self.redis.incr(key)
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # InMemoryLRUCache 는 time.monotonic 으로 만료를 판단
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request, clock) -> StatisticsCache:
+    if request.param == "memory":
+        backend = InMemoryLRUCache()
+        return StatisticsCache(backend, TTL, InMemoryAsyncCache(backend))
+    redis = FakeRedis(clock)
+    return StatisticsCache(RedisCache(redis), TTL, AsyncRedisCache(FakeAsyncRedis(redis)))
+
+class Builder:
+    """호출 횟수를 세는 통계 계산 함수 대역"""
+    
+    def __init__(self, hospital_id: int = 1):
+        self.hospital_id = hospital_id
+        self.calls = 0
+    
+    def __call__(self) -> Snapshot:
+        self.calls += 1
+        return Snapshot(hospital_id=self.hospital_id, build=self.calls)
+    
+    async def build_async(self) -> Snapshot:
+        return self()
+
+def fetch(cache: StatisticsCache, builder: Builder, period: str = "month") -> Snapshot:
+    return cache.get_or_build(Snapshot, "period", builder.hospital_id, {"period": period}, builder)
+
+def test_hit_and_miss_counters(cache):
+    builder = Builder()
+    
+    assert fetch(cache, builder).build == 1
+    assert fetch(cache, builder).build == 1
+    assert fetch(cache, builder, period="week").build == 2
+    
+    assert builder.calls == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["errors"]) == (1, 2, 0)
+    assert stats["hit_rate"] == 33.3
+
+def test_entries_expire_after_ttl(cache, clock):
+    builder = Builder()
+    fetch(cache, builder)
+    
+    clock.advance(TTL - 1)
+    assert fetch(cache, builder).build == 1
+    
+    clock.advance(2)
+    assert fetch(cache, builder).build == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_version_bump_invalidates_only_that_hospital(cache):
+    first, second = Builder(1), Builder(2)
+    fetch(cache, first)
+    fetch(cache, second)
+    
+    cache.invalidate_hospital(1)
+    
+    assert fetch(cache, first).build == 2
+    assert fetch(cache, second).build == 1
+    assert cache.invalidations == 1
+    assert cache.backend.get_counter("stats:1:version") == 1
+
+def test_async_path_shares_entries_and_versions(cache):
+    builder = Builder()
+    
+    async def scenario():
+        cached = await cache.get_or_build_async(Snapshot, "period", 1, {"period": "month"}, builder.build_async)
+        await cache.invalidate_hospital_async(1)
+        rebuilt = await cache.get_or_build_async(Snapshot, "period", 1, {"period": "month"}, builder.build_async)
+        return cached, rebuilt
+    
+    fetch(cache, builder)
+    cached, rebuilt = asyncio.run(scenario())
+    
+    assert (cached.build, rebuilt.build) == (1, 2)
+    # 비동기 무효화가 올린 버전을 동기 경로도 본다
+    assert fetch(cache, builder).build == 2
+
+def test_reservation_status_hooks_invalidate_hospital(cache, monkeypatch):
+    monkeypatch.setattr(cache_module, "statistics_cache", cache)
+    builder = Builder()
+    fetch(cache, builder)
+    
+    on_reservation_status_changed(1)
+    assert fetch(cache, builder).build == 2
+    
+    asyncio.run(on_reservation_status_changed_async(1))
+    assert fetch(cache, builder).build == 3
+    assert cache.invalidations == 2
+
+# alembic/versions/20261017_0001_hospital_daily_stats.py
+"""hospital_daily_stats 집계 테이블 추가 (결제 매출 일간 집계)
+
+예약 지표는 reservations 에서 직접 계산하므로 결제 집계 컬럼만 만든다.
+
+Revision ID: 20261017_0001
+Revises: (없음 - 이 마이그레이션 체인의 첫 리비전)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "hospital_daily_stats",
+        sa.Column("hospital_id", sa.Integer(), sa.ForeignKey("hospitals.id"), primary_key=True),
+        sa.Column("stat_date", sa.Date(), primary_key=True),
+        sa.Column("payment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_amount", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("refunded_amount", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
     )
+    # 테이블 생성 후 scripts/backfill_hospital_daily_stats.py 로 기존 데이터 백필
+
+def downgrade():
+    op.drop_table("hospital_daily_stats")
 
 # main.py에 라우터 추가
 from app.api.v1.endpoints import statistics
 
-app.include_router(statistics.router, prefix="/api/v1/statistics", tags=["statistics"])
\ No newline at end of file
+app.include_router(statistics.router, prefix="/api/v1/statistics", tags=["statistics"])
+
+# 예약 생성/상태 변경 서비스에 추가 (services/reservation.py)
+# from app.core.cache import on_reservation_status_changed
+# db.commit() 후 on_reservation_status_changed(reservation.hospital_id)